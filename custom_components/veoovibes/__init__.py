@@ -1,27 +1,96 @@
 from __future__ import annotations
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers import device_registry as dr
 from homeassistant.const import Platform
-from .const import DOMAIN, CONF_HOST, CONF_API_KEY, CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
+from homeassistant.components import webhook
+from .const import (
+    DOMAIN,
+    CONF_HOST,
+    CONF_API_KEY,
+    CONF_SCAN_INTERVAL,
+    DEFAULT_SCAN_INTERVAL,
+    CONF_BATCH_STATUS,
+    DEFAULT_BATCH_STATUS,
+    CONF_MAX_PARALLEL,
+    DEFAULT_MAX_PARALLEL,
+    CONF_PUSH,
+    DEFAULT_PUSH,
+    CONF_WEBHOOK_ID,
+)
 from .api import VeoovibesApi
+from .hub import async_get_hub, async_release_hub
 from .coordinator import VeoovibesCoordinator
+from .push import VeoovibesPushReceiver
+from .store import SnapshotStore
 
-PLATFORMS: list[Platform] = [Platform.MEDIA_PLAYER]
+PLATFORMS: list[Platform] = [Platform.MEDIA_PLAYER, Platform.SENSOR]
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    session = async_get_clientsession(hass)
-    api = VeoovibesApi(session, entry.data[CONF_HOST], entry.data[CONF_API_KEY])
+    # all controllers share the hub's keep-alive pool, request budget and sweep scheduler
+    hub = async_get_hub(hass, entry.entry_id)
+    max_parallel = entry.options.get(CONF_MAX_PARALLEL, DEFAULT_MAX_PARALLEL)
+    api = VeoovibesApi(hub.session, entry.data[CONF_HOST], entry.data[CONF_API_KEY], max_parallel=max_parallel, budget=hub.budget)
 
-    coord = VeoovibesCoordinator(hass, api, entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL))
-    await coord.async_config_entry_first_refresh()
+    coord = VeoovibesCoordinator(
+        hass,
+        api,
+        entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
+        batch_status=entry.options.get(CONF_BATCH_STATUS, DEFAULT_BATCH_STATUS),
+        scheduled=False,
+    )
+    coord.snapshot_store = SnapshotStore(hass, entry.entry_id)
+    snapshot = await coord.snapshot_store.async_load()
+    if snapshot is not None:
+        # start from the last good snapshot; the hub's first sweep revalidates it in the background
+        coord.async_restore(snapshot)
+        entry.async_create_background_task(hass, coord.favorites.async_refresh(), f"{DOMAIN} favorites {api.host}")
+    else:
+        # nothing to show yet: the controller must answer (ConfigEntryNotReady retries otherwise)
+        try:
+            await coord.async_config_entry_first_refresh()
+        except Exception:
+            await async_release_hub(hass, entry.entry_id)
+            raise
+        await coord.favorites.async_refresh()
+        coord.async_schedule_save()
+    entry.async_on_unload(coord.favorites.async_start())
 
-    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {"api": api, "coordinator": coord}
+    push = None
+    if entry.options.get(CONF_PUSH, DEFAULT_PUSH):
+        if CONF_WEBHOOK_ID not in entry.data:
+            hass.config_entries.async_update_entry(entry, data={**entry.data, CONF_WEBHOOK_ID: webhook.async_generate_id()})
+        push = VeoovibesPushReceiver(hass, coord, entry.data[CONF_WEBHOOK_ID])
+        push.async_register(entry.title)
+        entry.async_on_unload(push.async_unregister)
+
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {"api": api, "coordinator": coord, "push": push}
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    hub.register(entry.entry_id, coord)
+    entry.async_on_unload(entry.add_update_listener(_async_reload_entry))
     return True
 
+async def _async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    await hass.config_entries.async_reload(entry.entry_id)
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id, None)
+        data = hass.data[DOMAIN].pop(entry.entry_id, None)
+        # stop background reads before the hub may close the shared session
+        if data is not None:
+            await data["coordinator"].async_shutdown()
+        await async_release_hub(hass, entry.entry_id)
     return unload_ok
+
+async def async_remove_config_entry_device(hass: HomeAssistant, entry: ConfigEntry, device: dr.DeviceEntry) -> bool:
+    # rooms the controller no longer reports keep their device until the user deletes it here
+    data = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if data is None:
+        return True
+    host = data["api"].host
+    current = {(DOMAIN, f"{host}-{rid}") for rid in (data["coordinator"].data or {}).get("rooms", {})}
+    return not device.identifiers & current
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    await SnapshotStore(hass, entry.entry_id).async_remove()
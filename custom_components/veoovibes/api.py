@@ -1,77 +1,100 @@
 from __future__ import annotations
-from typing import Any, Dict, Iterable
-from yarl import URL
+from typing import Any, Callable, Dict, Iterable
 import aiohttp
 import logging
+from .const import DEFAULT_MAX_PARALLEL
+from .transport import (
+    VeoovibesTransport,
+    VeoovibesError,
+    VeoovibesConnectionError,
+    VeoovibesTimeoutError,
+    VeoovibesUnavailableError,
+    VeoovibesApiError,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+__all__ = [
+    "VeoovibesApi",
+    "VeoovibesError",
+    "VeoovibesConnectionError",
+    "VeoovibesTimeoutError",
+    "VeoovibesUnavailableError",
+    "VeoovibesApiError",
+]
+
 class VeoovibesApi:
-    def __init__(self, session: aiohttp.ClientSession, host: str, api_key: str) -> None:
-        self._session = session
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        host: str,
+        api_key: str,
+        max_parallel: int = DEFAULT_MAX_PARALLEL,
+        budget: Any = None,
+    ) -> None:
         self._host = host
         self._api_key = api_key
+        self.transport = VeoovibesTransport(session, host, max_parallel=max_parallel, budget=budget)
 
     @property
     def host(self) -> str:
         return self._host
 
-    def _url(self, path: str) -> URL:
-        return URL.build(scheme="http", host=self._host) / "api" / "v1" / path
+    @property
+    def available(self) -> bool:
+        return self.transport.available
+
+    def _query(self, params: Dict[str, Any]) -> list[tuple[str, str]]:
+        return [("api_key", self._api_key)] + [(k, str(v)) for k, v in params.items() if v is not None]
 
     async def _get(self, path: str, **params: Any) -> Dict[str, Any]:
-        params = {"api_key": self._api_key, **{k: v for k, v in params.items() if v is not None}}
-        timeout = aiohttp.ClientTimeout(total=10)
-        async with self._session.get(self._url(path), params=params, timeout=timeout) as resp:
-            resp.raise_for_status()
-            data = await resp.json(content_type=None)
-            if data.get("status") != "succeeded":
-                raise RuntimeError(f"API failed {path}: {data}")
-            return data
+        return await self.transport.get_json(path, self._query(params))
+
+    # controls are not retried: room_next / room_vol_up must not fire twice
+    async def _command(self, path: str, **params: Any) -> Dict[str, Any]:
+        return await self.transport.get_json(path, self._query(params), idempotent=False)
 
     # ---------- Reads ----------
     async def list_rooms(self) -> Dict[str, Any]:
         return await self._get("listrooms")
 
-    async def room_player_status(self, room: str | int) -> Dict[str, Any]:
-        return await self._get("room_player_status", room=room)
+    # per-room read: a dead amplifier must not trip the controller's breaker (see RoomHealth)
+    async def room_player_status(self, room: str | int, on_start: Callable[[], None] | None = None) -> Dict[str, Any]:
+        return await self.transport.get_json("room_player_status", self._query({"room": room}), isolated=True, on_start=on_start)
 
     async def get_room_feedback(self, room_ids: Iterable[int | str]) -> Dict[str, Any]:
         params = [("api_key", self._api_key)]
         for r in room_ids:
             params.append(("room[]", str(r)))
-        timeout = aiohttp.ClientTimeout(total=10)
-        async with self._session.get(self._url("get_room_feedback"), params=params, timeout=timeout) as resp:
-            resp.raise_for_status()
-            data = await resp.json(content_type=None)
-            if data.get("status") != "succeeded":
-                raise RuntimeError(f"API failed get_room_feedback: {data}")
-            return data
+        return await self.transport.get_json("get_room_feedback", params)
+
+    async def fetch_image(self, url: str) -> tuple[bytes, str | None]:
+        return await self.transport.get_bytes(url)
 
-    async def list_favorites(self) -> Dict[str, Any]:
-        return await self._get("listFavorites")
+    async def list_favorites_conditional(self, etag: str | None) -> tuple[Dict[str, Any] | None, str | None]:
+        return await self.transport.get_json_conditional("listFavorites", self._query({}), etag)
 
     # ---------- Controls (ROOM endpoints) ----------
     async def room_play(self, room: str | int) -> None:
-        await self._get("room_play", room=room)
+        await self._command("room_play", room=room)
 
     async def room_stop(self, room: str | int) -> None:
-        await self._get("room_stop", room=room)
+        await self._command("room_stop", room=room)
 
     async def room_next(self, room: str | int) -> None:
-        await self._get("room_next", room=room)
+        await self._command("room_next", room=room)
 
     async def room_prev(self, room: str | int) -> None:
-        await self._get("room_prev", room=room)
+        await self._command("room_prev", room=room)
 
     async def room_vol_set(self, room: str | int, vol: int) -> None:
-        await self._get("room_vol_set", room=room, vol=vol)
+        await self._command("room_vol_set", room=room, vol=vol)
 
     async def room_vol_up(self, room: str | int) -> None:
-        await self._get("room_vol_up", room=room)
+        await self._command("room_vol_up", room=room)
 
     async def room_vol_down(self, room: str | int) -> None:
-        await self._get("room_vol_down", room=room)
+        await self._command("room_vol_down", room=room)
 
     async def play_favorite(self, room: str | int, fav_id: str) -> None:
-        await self._get("playfavorite", room=room, favId=fav_id)
+        await self._command("playfavorite", room=room, favId=fav_id)
@@ -0,0 +1,79 @@
+from __future__ import annotations
+import asyncio, logging
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Tuple
+from homeassistant.core import HomeAssistant
+from .api import VeoovibesApi
+from .const import COMMAND_BATCH_WINDOW
+
+if TYPE_CHECKING:
+    from .coordinator import VeoovibesCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Collects room commands issued within COMMAND_BATCH_WINDOW (a scene or a multi-entity service
+# call arrives as one call per entity), sends them concurrently - in order per room, bounded by
+# the transport's parallelism - and follows up with a single refresh for all touched rooms.
+class CommandBatcher:
+    def __init__(self, hass: HomeAssistant, api: VeoovibesApi, coordinator: VeoovibesCoordinator) -> None:
+        self._hass = hass
+        self._api = api
+        self._coordinator = coordinator
+        self._pending: Dict[str, List[Tuple[str, Tuple[Any, ...], asyncio.Future]]] = {}
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self.batches = 0
+        self.commands = 0
+
+    async def async_send(self, command: str, rooms: Iterable[str], *args: Any) -> None:
+        futures = []
+        for rid in rooms:
+            fut = self._hass.loop.create_future()
+            self._pending.setdefault(str(rid), []).append((command, args, fut))
+            futures.append(fut)
+        if not futures:
+            return
+        if self._flush_handle is None:
+            self._flush_handle = self._hass.loop.call_later(COMMAND_BATCH_WINDOW, self._schedule_flush)
+        results = await asyncio.gather(*futures, return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+    def _schedule_flush(self) -> None:
+        self._flush_handle = None
+        self._hass.async_create_task(self._async_flush())
+
+    async def _async_run_room(self, rid: str, queue: List[Tuple[str, Tuple[Any, ...], asyncio.Future]]) -> None:
+        for command, args, fut in queue:
+            try:
+                await getattr(self._api, command)(rid, *args)
+            except Exception as e:
+                _LOGGER.debug("%s failed for room %s: %s", command, rid, e)
+                if not fut.done():
+                    fut.set_exception(e)
+            else:
+                if not fut.done():
+                    fut.set_result(None)
+
+    async def _async_flush(self) -> None:
+        pending, self._pending = self._pending, {}
+        if not pending:
+            return
+        self.batches += 1
+        self.commands += sum(len(q) for q in pending.values())
+        await asyncio.gather(*(self._async_run_room(rid, queue) for rid, queue in pending.items()))
+        for rid in pending:
+            self._coordinator.boost_room(rid)
+        await self._coordinator.async_request_rooms_refresh(pending)
+
+    def cancel(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        for queue in self._pending.values():
+            for _, _, fut in queue:
+                if not fut.done():
+                    fut.cancel()
+        self._pending.clear()
+
+    def diagnostics(self) -> Dict[str, Any]:
+        return {"batches": self.batches, "commands": self.commands}
@@ -1,40 +1,154 @@
 from __future__ import annotations
+import ipaddress
 from typing import Any
 import voluptuous as vol
 from homeassistant import config_entries
-from homeassistant.core import HomeAssistant
+from homeassistant.components import network
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
-from .const import DOMAIN, CONF_HOST, CONF_API_KEY, CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
-from .api import VeoovibesApi
+from .const import (
+    DOMAIN,
+    CONF_HOST,
+    CONF_API_KEY,
+    CONF_SCAN_INTERVAL,
+    DEFAULT_SCAN_INTERVAL,
+    CONF_BATCH_STATUS,
+    DEFAULT_BATCH_STATUS,
+    CONF_MAX_PARALLEL,
+    DEFAULT_MAX_PARALLEL,
+    MAX_PARALLEL_LIMIT,
+    CONF_PUSH,
+    DEFAULT_PUSH,
+)
+from .discovery import async_probe, async_scan, scan_hosts
+
+CONF_SUBNET = "subnet"
 
 class VeoovibesConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     VERSION = 1
 
+    def __init__(self) -> None:
+        self._api_key: str | None = None
+        self._found: dict[str, dict[str, Any]] = {}
+        self._discovered: dict[str, Any] | None = None
+
     async def async_step_user(self, user_input: dict[str, Any] | None = None) -> FlowResult:
+        return self.async_show_menu(step_id="user", menu_options=["manual", "scan"])
+
+    async def async_step_manual(self, user_input: dict[str, Any] | None = None) -> FlowResult:
         errors: dict[str, str] = {}
         if user_input is not None:
-            session = async_get_clientsession(self.hass)
-            api = VeoovibesApi(session, user_input[CONF_HOST], user_input[CONF_API_KEY])
-            try:
-                data = await api.list_rooms()
-                if data.get("status") != "succeeded":
-                    errors["base"] = "cannot_connect"
-                else:
-                    await self.async_set_unique_id(f"veoovibes:{user_input[CONF_HOST]}")
-                    self._abort_if_unique_id_configured()
-                    return self.async_create_entry(title=f"veoovibes ({user_input[CONF_HOST]})", data=user_input)
-            except Exception:
+            # one short listrooms probe, not the retrying transport: a wrong address fails within PROBE_TIMEOUT
+            probe = await async_probe(self.hass, user_input[CONF_HOST], user_input[CONF_API_KEY], use_cache=False)
+            if probe is None:
                 errors["base"] = "cannot_connect"
+            elif not probe["authorized"]:
+                errors["base"] = "invalid_auth"
+            else:
+                await self.async_set_unique_id(f"veoovibes:{user_input[CONF_HOST]}")
+                self._abort_if_unique_id_configured()
+                return self.async_create_entry(title=f"veoovibes ({user_input[CONF_HOST]})", data=user_input)
 
         schema = vol.Schema({
             vol.Required(CONF_HOST): str,
             vol.Required(CONF_API_KEY): str,
         })
-        return self.async_show_form(step_id="user", data_schema=schema, errors=errors)
+        return self.async_show_form(step_id="manual", data_schema=schema, errors=errors)
+
+    # ---------- Discovery ----------
+    def _configured_hosts(self) -> set[str]:
+        return {e.data.get(CONF_HOST) for e in self._async_current_entries(include_ignore=False)}
+
+    async def _default_subnet(self) -> str:
+        try:
+            ip = await network.async_get_source_ip(self.hass)
+        except Exception:  # no usable source address; the user types the subnet
+            return ""
+        return str(ipaddress.ip_network(f"{ip}/24", strict=False))
+
+    async def async_step_scan(self, user_input: dict[str, Any] | None = None) -> FlowResult:
+        errors: dict[str, str] = {}
+        if user_input is not None:
+            try:
+                hosts = scan_hosts(user_input[CONF_SUBNET])
+            except ValueError:
+                errors[CONF_SUBNET] = "invalid_subnet"
+            else:
+                configured = self._configured_hosts()
+                found = await async_scan(self.hass, [h for h in hosts if h not in configured], user_input[CONF_API_KEY])
+                self._api_key = user_input[CONF_API_KEY]
+                self._found = {r["host"]: r for r in found if r["authorized"]}
+                if self._found:
+                    return await self.async_step_pick()
+                errors["base"] = "invalid_auth" if found else "no_devices_found"
+
+        defaults = user_input or {}
+        schema = vol.Schema({
+            vol.Required(CONF_API_KEY, default=defaults.get(CONF_API_KEY, "")): str,
+            vol.Required(CONF_SUBNET, default=defaults.get(CONF_SUBNET) or await self._default_subnet()): str,
+        })
+        return self.async_show_form(step_id="scan", data_schema=schema, errors=errors)
+
+    async def async_step_pick(self, user_input: dict[str, Any] | None = None) -> FlowResult:
+        if user_input is not None:
+            host = user_input[CONF_HOST]
+            # every other controller found gets its own discovery flow, confirmed with one click each
+            for other, info in self._found.items():
+                if other != host:
+                    self.hass.async_create_task(
+                        self.hass.config_entries.flow.async_init(
+                            DOMAIN,
+                            context={"source": config_entries.SOURCE_INTEGRATION_DISCOVERY},
+                            data={**info, CONF_API_KEY: self._api_key},
+                        )
+                    )
+            await self.async_set_unique_id(f"veoovibes:{host}")
+            self._abort_if_unique_id_configured()
+            return self.async_create_entry(title=f"veoovibes ({host})", data={CONF_HOST: host, CONF_API_KEY: self._api_key})
+
+        options = {host: f"{host} – {info['rooms']} rooms" for host, info in sorted(self._found.items())}
+        schema = vol.Schema({vol.Required(CONF_HOST): vol.In(options)})
+        return self.async_show_form(
+            step_id="pick",
+            data_schema=schema,
+            description_placeholders={"count": str(len(options))},
+        )
+
+    async def async_step_integration_discovery(self, discovery_info: dict[str, Any]) -> FlowResult:
+        host = discovery_info[CONF_HOST]
+        await self.async_set_unique_id(f"veoovibes:{host}")
+        self._abort_if_unique_id_configured()
+        self._discovered = discovery_info
+        self.context["title_placeholders"] = {"host": host, "rooms": str(discovery_info.get("rooms", 0))}
+        return await self.async_step_discovery_confirm()
+
+    async def async_step_discovery_confirm(self, user_input: dict[str, Any] | None = None) -> FlowResult:
+        info = self._discovered or {}
+        host = info[CONF_HOST]
+        if user_input is not None:
+            # fresh probe (refreshing the cache): aborts if the controller stopped answering meanwhile
+            probe = await async_probe(self.hass, host, info[CONF_API_KEY], use_cache=False)
+            if probe is None or not probe["authorized"]:
+                return self.async_abort(reason="cannot_connect")
+            return self.async_create_entry(title=f"veoovibes ({host})", data={CONF_HOST: host, CONF_API_KEY: info[CONF_API_KEY]})
+
+        self._set_confirm_only()
+        return self.async_show_form(
+            step_id="discovery_confirm",
+            description_placeholders={
+                "host": host,
+                "rooms": str(info.get("rooms", 0)),
+                "names": ", ".join(info.get("names", [])[:10]),
+            },
+        )
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: config_entries.ConfigEntry) -> config_entries.OptionsFlow:
+        return VeoovibesOptionsFlowHandler(config_entry)
 
     async def async_step_import(self, import_config: dict[str, Any]) -> FlowResult:
-        return await self.async_step_user(import_config)
+        return await self.async_step_manual(import_config)
 
 class VeoovibesOptionsFlowHandler(config_entries.OptionsFlow):
     def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
@@ -46,8 +160,8 @@ class VeoovibesOptionsFlowHandler(config_entries.OptionsFlow):
 
         schema = vol.Schema({
             vol.Optional(CONF_SCAN_INTERVAL, default=self.config_entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)): vol.All(int, vol.Range(min=1, max=30)),
+            vol.Optional(CONF_BATCH_STATUS, default=self.config_entry.options.get(CONF_BATCH_STATUS, DEFAULT_BATCH_STATUS)): bool,
+            vol.Optional(CONF_MAX_PARALLEL, default=self.config_entry.options.get(CONF_MAX_PARALLEL, DEFAULT_MAX_PARALLEL)): vol.All(int, vol.Range(min=1, max=MAX_PARALLEL_LIMIT)),
+            vol.Optional(CONF_PUSH, default=self.config_entry.options.get(CONF_PUSH, DEFAULT_PUSH)): bool,
         })
         return self.async_show_form(step_id="init", data_schema=schema)
-
-async def async_get_options_flow(config_entry: config_entries.ConfigEntry):
-    return VeoovibesOptionsFlowHandler(config_entry)
@@ -3,5 +3,50 @@ DEFAULT_SCAN_INTERVAL = 1  # seconds
 CONF_HOST = "host"
 CONF_API_KEY = "api_key"
 CONF_SCAN_INTERVAL = "scan_interval"
+CONF_BATCH_STATUS = "batch_status"
+DEFAULT_BATCH_STATUS = True
+CONF_MAX_PARALLEL = "max_parallel"
+DEFAULT_MAX_PARALLEL = 4  # concurrent requests per controller
+MAX_PARALLEL_LIMIT = 16
+CONF_PUSH = "push"
+DEFAULT_PUSH = False
+CONF_WEBHOOK_ID = "webhook_id"
 FAV_REFRESH_SECONDS = 120  # throttle fetching favorites
+FAV_PAGE_SIZE = 100  # favorites per browse page
 CTX_FAVORITE = "veoovibes_favorite"
+ROOMS_REFRESH_SECONDS = 300  # room list rarely changes
+ROOM_STATUS_DEADLINE = 1.5  # seconds a sweep waits for a room's status before probing it in the background
+ROOM_FAILURE_THRESHOLD = 3  # consecutive status failures before a room is reported unavailable
+ROOM_PROBE_MAX_INTERVAL = 60  # seconds, back-off cap for re-probing a failing room
+ROOM_REMOVE_AFTER = 3  # consecutive room listings a room must be missing from before it is removed
+TOPOLOGY_REFRESH_COOLDOWN = 10  # seconds, on-demand room list reloads are coalesced this long
+SIGNAL_ROOMS_CHANGED = f"{DOMAIN}_rooms_changed"  # suffixed with the controller host
+IDLE_MAX_INTERVAL = 30  # seconds, upper bound for idle room back-off
+BOOST_SECONDS = 15  # keep a commanded room on the fast cadence this long
+STATUS_MAX_AGE = 60  # seconds, batch mode re-reads room_player_status at least this often
+COVER_CACHE_SIZE = 32  # album art images kept in memory per controller
+ROOM_REFRESH_COOLDOWN = 0.5  # seconds, coalesces targeted refreshes after commands
+COMMAND_BATCH_WINDOW = 0.05  # seconds, room commands issued together are sent as one batch
+OPTIMISTIC_TTL = 5  # seconds, optimistic values are dropped after this even without a refresh
+VOLUME_DEBOUNCE = 0.25  # seconds, only the latest volume of a burst is sent
+CONNECTION_LIMIT = 4  # keep-alive connections per controller
+KEEPALIVE_SECONDS = 30
+CONNECT_TIMEOUT = 2  # seconds, LAN controllers answer fast or not at all
+READ_TIMEOUT = 4  # seconds
+REQUEST_RETRIES = 2  # extra attempts for idempotent reads
+RETRY_BACKOFF = 0.2  # seconds, base delay before a jittered retry
+BREAKER_THRESHOLD = 5  # consecutive failures before the host is marked unavailable
+BREAKER_COOLDOWN = 5  # seconds, doubled on every failed probe
+BREAKER_MAX_COOLDOWN = 60
+PUSH_STALE_SECONDS = 300  # without a push for this long, polling resumes full cadence
+PUSH_SAFETY_INTERVAL = 30  # seconds, poll floor while push is live
+HUB_TICK = 1.0  # seconds, domain scheduler tick; controller sweeps are staggered within it
+GLOBAL_CONNECTION_LIMIT = 64  # connections across all controllers
+GLOBAL_REQUEST_BUDGET = 40  # requests per second across all controllers
+GLOBAL_REQUEST_BURST = 80
+POSITION_DRIFT = 2.0  # seconds, larger jumps of the reported position are treated as a seek
+PROBE_TIMEOUT = 1.0  # seconds, discovery probe per candidate host
+PROBE_CONCURRENCY = 64  # discovery probes in flight
+PROBE_CACHE_SECONDS = 300  # discovery results (hits and misses) are reused this long
+SCAN_MAX_HOSTS = 1024  # largest subnet a scan accepts (/22)
+SNAPSHOT_SAVE_DELAY = 60  # seconds, last good snapshot is written at most this often
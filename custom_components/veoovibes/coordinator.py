@@ -1,59 +1,633 @@
 from __future__ import annotations
 import logging, asyncio, time
+from collections import OrderedDict
 from datetime import timedelta
-from typing import Any, Dict
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
-from .api import VeoovibesApi
-from .const import DEFAULT_SCAN_INTERVAL, FAV_REFRESH_SECONDS
+from typing import Any, Callable, Dict, Iterable
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from .api import VeoovibesApi, VeoovibesApiError, VeoovibesError
+from .const import (
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_BATCH_STATUS,
+    ROOMS_REFRESH_SECONDS,
+    ROOM_REMOVE_AFTER,
+    TOPOLOGY_REFRESH_COOLDOWN,
+    SIGNAL_ROOMS_CHANGED,
+    STATUS_MAX_AGE,
+    ROOM_STATUS_DEADLINE,
+    COVER_CACHE_SIZE,
+    ROOM_REFRESH_COOLDOWN,
+    OPTIMISTIC_TTL,
+    PUSH_STALE_SECONDS,
+    PUSH_SAFETY_INTERVAL,
+)
+from .commands import CommandBatcher
+from .favorites import FavoritesStore
+from .health import RoomHealth
+from .metrics import Metrics
+from .model import RoomState, build_room_state
+from .scheduler import RoomScheduler
+from .store import SnapshotStore
 
 _LOGGER = logging.getLogger(__name__)
 
 class VeoovibesCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
-    def __init__(self, hass: HomeAssistant, api: VeoovibesApi, scan_interval: int = DEFAULT_SCAN_INTERVAL) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        api: VeoovibesApi,
+        scan_interval: int = DEFAULT_SCAN_INTERVAL,
+        batch_status: bool = DEFAULT_BATCH_STATUS,
+        scheduled: bool = True,
+    ) -> None:
+        # scheduled=False: sweeps are driven externally (see hub.VeoovibesHub)
         super().__init__(
             hass,
             logger=_LOGGER,
             name="veoovibes",
-            update_interval=timedelta(seconds=scan_interval),
+            update_interval=timedelta(seconds=scan_interval) if scheduled else None,
         )
         self.api = api
-        self._favorites_cache: Dict[str, Any] | None = None
-        self._favorites_last: float = 0.0
+        self.scheduler = RoomScheduler(scan_interval)
+        self.health = RoomHealth(scan_interval)
+        self.batch_status = batch_status
+        self.favorites = FavoritesStore(hass, api)
+        self._rooms: Dict[str, Any] | None = None
+        self._rooms_last: float = 0.0
+        self._rooms_next: float = 0.0
+        self._rooms_missing: Dict[str, int] = {}
+        self.snapshot_store: SnapshotStore | None = None
+        self._room_status: Dict[str, Dict[str, Any]] = {}
+        self._status_last: Dict[str, float] = {}
+        self._fb_text: Dict[str, Dict[str, Any]] = {}
+        self._fb_vol: Dict[str, Dict[str, Any]] = {}
+        self._slices: Dict[str, tuple] = {}
+        self._states: Dict[str, RoomState] = {}
+        self._parsed: Dict[str, RoomState] = {}
+        # room -> (overrides, set at), applied on top of the parsed state until the command's refresh ran
+        self._optimistic: Dict[str, tuple[Dict[str, Any], float]] = {}
+        self._refresh_pending: set[str] = set()
+        self._rooms_refresher = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=ROOM_REFRESH_COOLDOWN,
+            immediate=False,
+            function=self._async_refresh_pending,
+        )
+        self._topology_refresher = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=TOPOLOGY_REFRESH_COOLDOWN,
+            immediate=True,
+            function=self._async_refresh_topology,
+        )
+        self.commands = CommandBatcher(hass, api, self)
+        self.favorites.on_change = self.async_schedule_save
+        self._groups: Dict[str, list[str]] = {}
+        self.entity_ids: Dict[str, str] = {}
+        self._covers: OrderedDict[str, tuple[bytes | None, str | None]] = OrderedDict()
+        self._changed_rooms: set[str] | None = None
+        self._tasks: set[asyncio.Task] = set()
+        self._closed = False
+        self._push_last: float | None = None
+        self.push_updates = 0
+        self._last_success_notified = True
+        self.notified_writes = 0
+        self.suppressed_writes = 0
 
-    async def _async_update_data(self) -> Dict[str, Any]:
+    @property
+    def push_live(self) -> bool:
+        return self._push_last is not None and (time.monotonic() - self._push_last) < PUSH_STALE_SECONDS
+
+    @property
+    def rooms_signal(self) -> str:
+        return f"{SIGNAL_ROOMS_CHANGED}_{self.api.host}"
+
+    @property
+    def metrics(self) -> Metrics:
+        return self.api.transport.metrics
+
+    def boost_room(self, room_id: str) -> None:
+        self.scheduler.boost(str(room_id), time.monotonic())
+
+    def poll_diagnostics(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        return {
+            "base_interval": self.scheduler.fast_interval,
+            "interval_floor": self.scheduler.floor,
+            "push": {
+                "live": self.push_live,
+                "updates": self.push_updates,
+                "last_age": round(now - self._push_last, 1) if self._push_last is not None else None,
+            },
+            "batch_status": self.batch_status,
+            "rooms_refresh_seconds": ROOMS_REFRESH_SECONDS,
+            "rooms_age": round(now - self._rooms_last, 1) if self._rooms is not None else None,
+            "rooms_missing": dict(self._rooms_missing),
+            "rooms": self.scheduler.diagnostics(now),
+            "unhealthy_rooms": self.health.diagnostics(now),
+            "transport": self.api.transport.diagnostics(),
+            "commands": self.commands.diagnostics(),
+            "zones": {leader: list(members) for leader, members in self._groups.items()},
+            "notified_writes": self.notified_writes,
+            "suppressed_writes": self.suppressed_writes,
+        }
+
+    async def async_get_cover(self, room_id: str) -> tuple[bytes | None, str | None]:
+        room = self._states.get(str(room_id))
+        if room is None or not room.cover:
+            return None, None
+        url = room.cover
+        key = f"{room.cover_token}:{url}"
+        if key in self._covers:
+            self._covers.move_to_end(key)
+            return self._covers[key]
+        try:
+            image = await self.api.fetch_image(url)
+        except VeoovibesError as e:
+            # remembered as missing until the track (and with it the cover token) changes
+            _LOGGER.debug("cover fetch failed for %s: %s", room_id, e)
+            image = (None, None)
+        self._covers[key] = image
+        while len(self._covers) > COVER_CACHE_SIZE:
+            self._covers.popitem(last=False)
+        return image
+
+    def _diff_rooms(self, rooms: Dict[str, Any]) -> set[str]:
+        slices = {
+            str(rid): (
+                self._room_status.get(str(rid)),
+                self._fb_text.get(str(rid)),
+                self._fb_vol.get(str(rid)),
+                rinfo,
+                self.health.flags(str(rid)),
+            )
+            for rid, rinfo in rooms.items()
+        }
+        changed = {rid for rid, sl in slices.items() if self._slices.get(rid) != sl}
+        changed.update(rid for rid in self._slices if rid not in slices)
+        self._slices = slices
+        return changed
+
+    @callback
+    def async_update_listeners(self) -> None:
+        # only wake entities whose RoomState changed; failures and external updates wake everyone
+        changed = self._changed_rooms
+        self._changed_rooms = None
+        if changed is None or self.last_update_success != self._last_success_notified:
+            self._last_success_notified = self.last_update_success
+            self.notified_writes += len(self._listeners)
+            super().async_update_listeners()
+            return
+        for update_callback, context in list(self._listeners.values()):
+            if context is None or context in changed:
+                self.notified_writes += 1
+                update_callback()
+            else:
+                self.suppressed_writes += 1
+
+    # returns (added, removed) room ids compared to the previous room list
+    async def _async_update_rooms(self, now: float) -> tuple[list[str], list[str]]:
         rooms_resp = await self.api.list_rooms()
-        rooms = rooms_resp.get("result") or {}
-        rids = [str(k) for k in rooms.keys()] if isinstance(rooms, dict) else []
-        _LOGGER.debug("veoovibes: loaded rooms: %s", rids)
+        rooms = rooms_resp.get("result")
+        if not isinstance(rooms, dict) or (not rooms and self._rooms):
+            # a controller that is still booting answers with no rooms; never take that as a removal
+            raise VeoovibesApiError(f"listrooms returned no rooms: {rooms!r}")
+        rooms = {str(k): v for k, v in rooms.items()}
+        previous = {str(k): v for k, v in (self._rooms or {}).items()}
+        # a room only goes away after it was missing from ROOM_REMOVE_AFTER listings in a row
+        for rid in list(self._rooms_missing):
+            if rid in rooms or rid not in previous:
+                self._rooms_missing.pop(rid)
+        for rid, info in previous.items():
+            if rid not in rooms:
+                self._rooms_missing[rid] = self._rooms_missing.get(rid, 0) + 1
+                if self._rooms_missing[rid] < ROOM_REMOVE_AFTER:
+                    rooms[rid] = info
+                else:
+                    self._rooms_missing.pop(rid)
+        rids = list(rooms)
+        _LOGGER.debug("veoovibes: loaded rooms: %s (missing: %s)", rids, self._rooms_missing)
+        self.scheduler.sync_rooms(rids)
+        self.health.sync_rooms(rids)
+        for cache in (self._room_status, self._status_last, self._fb_text, self._fb_vol):
+            for rid in [r for r in cache if r not in rooms]:
+                cache.pop(rid, None)
+        self._rooms = rooms
+        self._rooms_last = now
+        self._rooms_next = now + ROOMS_REFRESH_SECONDS
+        return [rid for rid in rids if rid not in previous], [rid for rid in previous if rid not in rooms]
 
-        async def _one(rid: str):
-            try:
-                d = await self.api.room_player_status(rid)
-                return rid, (d.get("result") or d)
-            except Exception as e:
-                _LOGGER.debug("room_player_status failed for %s: %s", rid, e)
-                return rid, {}
+    @callback
+    def _async_announce_rooms(self, added: list[str], removed: list[str]) -> None:
+        if not added and not removed:
+            return
+        _LOGGER.debug("veoovibes: rooms added %s, removed %s", added, removed)
+        names = {rid: self._states[rid].name for rid in added if rid in self._states}
+        async_dispatcher_send(self.hass, self.rooms_signal, names, removed)
+
+    async def async_request_topology_refresh(self) -> None:
+        await self._topology_refresher.async_call()
+
+    async def _async_refresh_topology(self) -> None:
+        if self._rooms is None:
+            return
+        now = time.monotonic()
+        try:
+            added, removed = await self._async_update_rooms(now)
+        except VeoovibesError as e:
+            _LOGGER.debug("listrooms failed: %s", e)
+            return
+        if added:
+            await self._async_poll_rooms(added, now, force_status=True)
+        self.async_set_updated_data(self._snapshot())
+        self._async_announce_rooms(added, removed)
+
+    # text_rids/vol_rids: rooms whose playertext/roomvolume entry this feedback replaces; such a room
+    # missing from its list has no text (stopped) or volume now
+    def _merge_feedback(self, feedback: Dict[str, Any], text_rids: Iterable[str], vol_rids: Iterable[str]) -> None:
+        for rid in text_rids:
+            self._fb_text.pop(rid, None)
+        for rid in vol_rids:
+            self._fb_vol.pop(rid, None)
+        for e in feedback.get("playertext", []) or []:
+            self._fb_text[str(e.get("roomid"))] = e
+        for e in feedback.get("roomvolume", []) or []:
+            self._fb_vol[str(e.get("roomid"))] = e
+        if self._rooms is not None and any(rid not in self._rooms for rid in (*self._fb_text, *self._fb_vol)):
+            # the controller reports a room we don't know yet: reload the room list soon
+            for cache in (self._fb_text, self._fb_vol):
+                for rid in [r for r in cache if r not in self._rooms]:
+                    cache.pop(rid, None)
+            self._track(self.async_request_topology_refresh(), "topology")
 
-        results = await asyncio.gather(*[_one(r) for r in rids], return_exceptions=False)
-        room_status = {rid: data for rid, data in results}
+    async def _async_read_status(self, rid: str, on_start: Callable[[], None] | None = None) -> Dict[str, Any] | None:
+        try:
+            d = await self.api.room_player_status(rid, on_start)
+        except VeoovibesError as e:
+            _LOGGER.debug("room_player_status failed for %s: %s", rid, e)
+            return None
+        return d.get("result") or d
 
-        feedback = {}
+    # status_due: rooms whose own schedule is up; the rest of `rids` only gets feedback (batch mode)
+    async def _async_poll_rooms(
+        self, rids: list[str], now: float, force_status: bool = False, status_due: Iterable[str] | None = None
+    ) -> int:
+        before = {rid: self._fb_text.get(rid) for rid in rids}
+        feedback_ok = False
         try:
             fb = await self.api.get_room_feedback(rids)
-            feedback = fb.get("result") or {}
-        except Exception as e:
+            self._merge_feedback(fb.get("result") or {}, rids, rids)
+            feedback_ok = True
+        except VeoovibesError as e:
             _LOGGER.debug("get_room_feedback failed: %s", e)
 
-        now = time.time()
-        favorites = self._favorites_cache
-        if favorites is None or (now - self._favorites_last) > FAV_REFRESH_SECONDS:
+        # a read still in flight for a room (slow sweep read or probe) is never duplicated
+        status_rids = [rid for rid in rids if not self.health.probing(rid)]
+        if not force_status:
+            # failing rooms are probed off the sweep (see _async_probe_rooms) so they never hold it up
+            status_rids = [rid for rid in status_rids if self.health.healthy(rid)]
+            due = set(rids if status_due is None else status_due)
+            if self.batch_status and feedback_ok:
+                # feedback is the primary source; player status when the room's text moved (e.g. new cover),
+                # otherwise only on the room's own back-off schedule
+                moved = {rid for rid in rids if before[rid] != self._fb_text.get(rid)}
+                status_rids = [
+                    rid for rid in status_rids
+                    if rid in moved
+                    or rid not in self._room_status
+                    or (rid in due and (now - self._status_last.get(rid, 0.0)) > STATUS_MAX_AGE)
+                ]
+                for rid in moved - due:
+                    # activity in a backed-off room: back to the fast cadence
+                    self.scheduler.record(rid, True, now)
+            else:
+                status_rids = [rid for rid in status_rids if rid in due]
+
+        failed = 0 if feedback_ok else len(rids)
+        if not status_rids:
+            return failed
+        # each read's deadline runs from the moment it holds a connection slot, so rooms queued behind
+        # max_parallel or the hub budget are not mistaken for slow ones; the queue as a whole gets
+        # one deadline per round of max_parallel reads
+        started: Dict[str, float] = {}
+        tasks = {
+            self._track(
+                self._async_read_status(rid, lambda rid=rid: started.setdefault(rid, time.monotonic())), f"status {rid}"
+            ): rid
+            for rid in status_rids
+        }
+        rounds = -(-len(status_rids) // self.api.transport.max_parallel)
+        limit = time.monotonic() + ROOM_STATUS_DEADLINE * (rounds + 1)
+        pending = set(tasks)
+        while pending:
+            clock = time.monotonic()
+            # a read that starts while we wait cannot expire earlier than ROOM_STATUS_DEADLINE from now
+            deadlines = [started[tasks[t]] + ROOM_STATUS_DEADLINE for t in pending if tasks[t] in started]
+            timeout = max(0.0, min(clock + ROOM_STATUS_DEADLINE, limit, *deadlines) - clock)
+            done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                rid = tasks[task]
+                data = task.result()
+                if data is None:
+                    # keep the last known status; the room is marked stale until a probe succeeds
+                    self.health.record_failure(rid, now)
+                    if feedback_ok:
+                        failed += 1
+                    continue
+                self.health.record_success(rid)
+                self._room_status[rid] = data
+                self._status_last[rid] = now
+            clock = time.monotonic()
+            expired = {
+                t for t in pending
+                if clock >= limit or (tasks[t] in started and clock >= started[tasks[t]] + ROOM_STATUS_DEADLINE)
+            }
+            for task in expired:
+                # too slow for the sweep: the read carries on as the room's probe, and only counts as
+                # a failure if it ends in a timeout or error
+                rid = tasks[task]
+                self.health.start_probe(rid)
+                task.add_done_callback(lambda t, rid=rid: self._async_late_status(rid, t))
+            pending -= expired
+        return failed
+
+    def _track(self, coro: Any, name: str) -> asyncio.Task:
+        # background reads are owned by the coordinator and cancelled on shutdown
+        task = self.hass.async_create_background_task(coro, f"veoovibes {self.api.host} {name}")
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    @callback
+    def _async_late_status(self, rid: str, task: asyncio.Task) -> None:
+        if not task.cancelled():
+            self._async_status_result(rid, task.result())
+
+    def _async_probe_rooms(self, now: float) -> None:
+        for rid in self.health.probes_due(now):
+            self._track(self._async_probe(rid), f"probe {rid}")
+
+    async def _async_probe(self, rid: str) -> None:
+        self._async_status_result(rid, await self._async_read_status(rid))
+
+    @callback
+    def _async_status_result(self, rid: str, data: Dict[str, Any] | None) -> None:
+        self.health.probe_done(rid)
+        if self._closed:
+            return
+        if data is None:
+            flags_before = self.health.flags(rid)
+            self.health.record_failure(rid, time.monotonic())
+            if self.health.flags(rid) == flags_before:
+                return
+        else:
+            if self.health.record_success(rid):
+                _LOGGER.debug("room %s recovered", rid)
+            self._room_status[rid] = data
+            self._status_last[rid] = time.monotonic()
+        if self._rooms is not None and rid in self._rooms:
+            self.async_set_updated_data(self._snapshot())
+
+    def _snapshot(self) -> Dict[str, Any]:
+        rooms = self._rooms or {}
+        dirty = self._diff_rooms(rooms)
+        now = time.monotonic()
+        for rid in [r for r, (_, at) in self._optimistic.items() if now - at > OPTIMISTIC_TTL or r not in self._slices]:
+            self._optimistic.pop(rid, None)
+        # raw controller JSON stays in the caches above; entities only see parsed RoomState records,
+        # and unchanged rooms keep the same object between ticks
+        self._parsed = {
+            rid: self._parsed[rid] if rid not in dirty and rid in self._parsed else build_room_state(
+                rid,
+                rooms.get(rid) or {},
+                self._room_status.get(rid) or {},
+                self._fb_text.get(rid) or {},
+                self._fb_vol.get(rid) or {},
+                self._parsed.get(rid),
+                now - self._status_last[rid] if rid in self._status_last else 0.0,
+                *self.health.flags(rid),
+            )
+            for rid in self._slices
+        }
+        previous = self._states
+        self._states = {rid: self._publish(rid, parsed, previous.get(rid)) for rid, parsed in self._parsed.items()}
+        # wake only rooms whose published state object changed (build_room_state and _publish return
+        # the previous object when nothing differs, e.g. a position that merely advanced), plus removals
+        self._changed_rooms = {rid for rid, room in self._states.items() if room is not previous.get(rid)}
+        self._changed_rooms.update(rid for rid in previous if rid not in self._states)
+        return {"rooms": self._states}
+
+    def _publish(self, rid: str, parsed: RoomState, previous: RoomState | None) -> RoomState:
+        override = self._optimistic.get(rid)
+        room = parsed.replace(**override[0]) if override is not None else parsed
+        if previous is not None and room is not previous and room == previous:
+            return previous
+        return room
+
+    def _record(self, rids: list[str], now: float) -> None:
+        for rid in rids:
+            room = self._states.get(rid)
+            self.scheduler.record(rid, room is not None and room.is_playing, now)
+
+    async def _async_update_data(self) -> Dict[str, Any]:
+        started = time.monotonic()
+        try:
+            data, polled, failed = await self._async_sweep()
+        except Exception:
+            self.metrics.record_refresh(time.monotonic() - started, False)
+            raise
+        self.metrics.record_refresh(time.monotonic() - started, True, polled, failed, len(self._slices) - polled)
+        return data
+
+    async def _async_sweep(self) -> tuple[Dict[str, Any], int, int]:
+        if not self.api.available:
+            raise UpdateFailed(f"veoovibes controller {self.api.host} unavailable, backing off")
+        now = time.monotonic()
+        # polling is only a safety net while push updates arrive; fall back to full cadence when they stop
+        self.scheduler.set_floor(PUSH_SAFETY_INTERVAL if self.push_live else 0.0)
+        # room topology is refreshed on its own slow schedule (or on demand), not every tick
+        added: list[str] = []
+        removed: list[str] = []
+        if self._rooms is None or now >= self._rooms_next:
+            try:
+                added, removed = await self._async_update_rooms(now)
+            except VeoovibesError as e:
+                if self._rooms is None:
+                    raise UpdateFailed(f"listrooms failed: {e}") from e
+                # keep polling the known rooms; retry the room list after a short cooldown
+                _LOGGER.debug("listrooms failed, using cached rooms: %s", e)
+                self._rooms_next = now + TOPOLOGY_REFRESH_COOLDOWN
+
+        self._async_probe_rooms(now)
+        due = self.scheduler.due(now)
+        # batch mode: one feedback call covers every room each tick, so a room starting to play is seen
+        # within a tick; the per-room back-off only spaces out its player status reads
+        polled = [str(rid) for rid in self._rooms or {}] if self.batch_status else due
+        failed = await self._async_poll_rooms(polled, now, status_due=due) if polled else 0
+
+        data = self._snapshot()
+        self._record(due, now)
+        if self._changed_rooms or added or removed:
+            self.async_schedule_save()
+        if self.data is not None:
+            # the first sweep's rooms are picked up by platform setup
+            self._async_announce_rooms(added, removed)
+        return data, len(polled), failed
+
+    # ---------- Snapshot ----------
+    @callback
+    def async_restore(self, snapshot: Dict[str, Any]) -> None:
+        # entities start from the last good snapshot; the first sweep revalidates the room list
+        self._rooms = snapshot["rooms"]
+        self._rooms_next = 0.0
+        self.scheduler.sync_rooms([str(rid) for rid in self._rooms])
+        states = snapshot.get("states") or {}
+        for rid in self._rooms:
             try:
-                fav_resp = await self.api.list_favorites()
-                favorites = fav_resp.get("result") or {}
-                self._favorites_cache = favorites
-                self._favorites_last = now
-            except Exception as e:
-                _LOGGER.debug("list_favorites failed: %s", e)
-
-        return {"rooms": rooms, "room_status": room_status, "feedback": feedback, "favorites": favorites or {}}
+                self._states[str(rid)] = RoomState.from_dict(states[str(rid)])
+            except (KeyError, TypeError):
+                self._states[str(rid)] = RoomState(str(rid), (self._rooms[rid] or {}).get("name") or f"Room {rid}")
+        self._parsed = dict(self._states)
+        self.favorites.restore(snapshot.get("favorites") or {})
+        self.data = {"rooms": self._states}
+
+    @callback
+    def async_schedule_save(self) -> None:
+        if self.snapshot_store is not None and self._rooms is not None and not self._closed:
+            self.snapshot_store.async_schedule_save(self._snapshot_data)
+
+    def _snapshot_data(self) -> Dict[str, Any]:
+        return {
+            "rooms": self._rooms or {},
+            "favorites": self.favorites.raw,
+            "states": {rid: room.as_dict() for rid, room in (self._parsed or self._states).items()},
+        }
+
+    # ---------- Targeted updates ----------
+    async def async_refresh_rooms(self, room_ids: Iterable[str]) -> None:
+        rids = [str(r) for r in room_ids if self._rooms is not None and str(r) in self._rooms]
+        if not rids:
+            return
+        now = time.monotonic()
+        await self._async_poll_rooms(rids, now, force_status=True)
+        # the controller has now been read after the command: overrides set before this refresh are done
+        for rid in rids:
+            override = self._optimistic.get(rid)
+            if override is not None and override[1] <= now:
+                self._optimistic.pop(rid)
+        data = self._snapshot()
+        self._record(rids, now)
+        self.async_set_updated_data(data)
+
+    async def async_request_rooms_refresh(self, room_ids: Iterable[str]) -> None:
+        # rooms requested within the cooldown are refreshed together: one feedback call, N statuses
+        self._refresh_pending.update(str(r) for r in room_ids)
+        await self._rooms_refresher.async_call()
+
+    async def _async_refresh_pending(self) -> None:
+        rids, self._refresh_pending = self._refresh_pending, set()
+        await self.async_refresh_rooms(rids)
+
+    @callback
+    def async_apply_optimistic(self, room_id: str, **changes: Any) -> None:
+        rid = str(room_id)
+        parsed = self._parsed.get(rid)
+        if parsed is None:
+            return
+        # kept until the targeted refresh after the command (or OPTIMISTIC_TTL), so sweeps reading
+        # the controller's not-yet-updated state don't flip the value back
+        override = self._optimistic.get(rid)
+        self._optimistic[rid] = ({**(override[0] if override else {}), **changes}, time.monotonic())
+        self._states[rid] = self._publish(rid, parsed, self._states.get(rid))
+        self._changed_rooms = {rid}
+        self.async_update_listeners()
+
+    # ---------- Push ----------
+    @callback
+    def async_apply_push(self, payload: Dict[str, Any]) -> None:
+        if self._rooms is None:
+            return
+        feedback = payload.get("result") if isinstance(payload.get("result"), dict) else payload
+        # a push may carry only one of the lists: each replaces the entries of the rooms it names, and
+        # with "rooms" also those of the listed rooms it leaves out
+        listed = {str(r) for r in (feedback.get("rooms") or [])}
+        text_rids, vol_rids = (
+            {str(e.get("roomid")) for e in (feedback.get(key) or [])} | (listed if key in feedback else set())
+            for key in ("playertext", "roomvolume")
+        )
+        rids = text_rids | vol_rids | listed
+        if any(rid not in self._slices for rid in rids):
+            self._track(self.async_request_topology_refresh(), "topology")
+        rids &= set(self._slices)
+        before = {rid: self._fb_text.get(rid) for rid in rids}
+        self._merge_feedback(feedback, text_rids & rids, vol_rids & rids)
+        pushed_status = {str(k): v for k, v in (feedback.get("room_status") or {}).items() if isinstance(v, dict)}
+        for rid, status in pushed_status.items():
+            if rid in self._slices:
+                self._room_status[rid] = status
+                self._status_last[rid] = time.monotonic()
+        self._push_last = time.monotonic()
+        self.push_updates += 1
+        self.async_set_updated_data(self._snapshot())
+        for rid in rids:
+            if before[rid] != self._fb_text.get(rid) and rid not in pushed_status:
+                # new track: pick up cover and status via a targeted read
+                self._track(self.async_request_rooms_refresh([rid]), f"refresh {rid}")
+
+    # ---------- Zones ----------
+    def group_rooms(self, room_id: str) -> list[str]:
+        rid = str(room_id)
+        for members in self._groups.values():
+            if rid in members:
+                return list(members)
+        return [rid]
+
+    @callback
+    def async_join(self, leader: str, room_ids: Iterable[str]) -> None:
+        leader = str(leader)
+        joining = [str(r) for r in room_ids if str(r) != leader and self._rooms is not None and str(r) in self._rooms]
+        affected = {leader, *joining}
+        for rid in joining:
+            affected.update(self._leave_group(rid))
+        members = self._groups.get(leader)
+        if members is None:
+            affected.update(self._leave_group(leader))
+            members = self._groups[leader] = [leader]
+        members.extend(r for r in joining if r not in members)
+        if len(members) < 2:
+            self._groups.pop(leader, None)
+        self._changed_rooms = affected
+        self.async_update_listeners()
+
+    @callback
+    def async_unjoin(self, room_id: str) -> None:
+        affected = self._leave_group(str(room_id))
+        self._changed_rooms = affected | {str(room_id)}
+        self.async_update_listeners()
+
+    def _leave_group(self, rid: str) -> set[str]:
+        for leader, members in list(self._groups.items()):
+            if rid not in members:
+                continue
+            affected = set(members)
+            if rid == leader or len(members) <= 2:
+                # a zone without its leader, or with a single room left, is dissolved
+                self._groups.pop(leader)
+            else:
+                members.remove(rid)
+            return affected
+        return set()
+
+    async def async_shutdown(self) -> None:
+        self._closed = True
+        for task in list(self._tasks):
+            task.cancel()
+        self._rooms_refresher.async_cancel()
+        self._topology_refresher.async_cancel()
+        self.commands.cancel()
+        if self.snapshot_store is not None:
+            await self.snapshot_store.async_flush()
+        await super().async_shutdown()
@@ -0,0 +1,22 @@
+from __future__ import annotations
+from typing import Any
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from .const import DOMAIN, CONF_API_KEY, CONF_WEBHOOK_ID
+from .coordinator import VeoovibesCoordinator
+from .hub import async_get_hub
+
+TO_REDACT = {CONF_API_KEY, CONF_WEBHOOK_ID}
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict[str, Any]:
+    data = hass.data[DOMAIN][entry.entry_id]
+    coord: VeoovibesCoordinator = data["coordinator"]
+    push = data.get("push")
+    return {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "polling": coord.poll_diagnostics(),
+        "metrics": coord.metrics.as_dict(),
+        "push_receiver": {"enabled": push is not None},
+        "hub": async_get_hub(hass).diagnostics(),
+    }
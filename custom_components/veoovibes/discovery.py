@@ -0,0 +1,69 @@
+from __future__ import annotations
+import asyncio, ipaddress, logging, time
+from typing import Any, Dict, List
+import aiohttp
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from .const import DOMAIN, PROBE_TIMEOUT, PROBE_CONCURRENCY, PROBE_CACHE_SECONDS, SCAN_MAX_HOSTS
+
+_LOGGER = logging.getLogger(__name__)
+
+PROBE_CACHE_KEY = "probe_cache"
+
+# Subnet scan for controllers: every candidate gets one short listrooms probe, run concurrently.
+# Results (including misses) are cached per host and key so repeated scans during a rollout only
+# probe what is new.
+def _cache(hass: HomeAssistant) -> Dict[tuple[str, str], tuple[float, Dict[str, Any] | None]]:
+    return hass.data.setdefault(DOMAIN, {}).setdefault(PROBE_CACHE_KEY, {})
+
+def scan_hosts(subnet: str) -> List[str]:
+    # raises ValueError for malformed or oversized networks
+    net = ipaddress.ip_network(subnet.strip(), strict=False)
+    if net.num_addresses > SCAN_MAX_HOSTS:
+        raise ValueError(f"{subnet} has more than {SCAN_MAX_HOSTS} addresses")
+    return [str(ip) for ip in (net.hosts() if net.num_addresses > 1 else [net.network_address])]
+
+async def _probe(session: aiohttp.ClientSession, host: str, api_key: str) -> Dict[str, Any] | None:
+    try:
+        async with session.get(
+            f"http://{host}/api/v1/listrooms",
+            params={"api_key": api_key},
+            timeout=aiohttp.ClientTimeout(total=PROBE_TIMEOUT),
+            allow_redirects=False,
+        ) as resp:
+            if resp.status != 200:
+                return None
+            data = await resp.json(content_type=None)
+    except (aiohttp.ClientError, asyncio.TimeoutError, ValueError, OSError):
+        return None
+    if not isinstance(data, dict) or "status" not in data:
+        return None
+    rooms = data.get("result") if data.get("status") == "succeeded" else None
+    if not isinstance(rooms, dict):
+        # answers like a controller but rejects the key
+        return {"host": host, "authorized": False, "rooms": 0, "names": []}
+    names = [str((r or {}).get("name") or rid) for rid, r in rooms.items()]
+    return {"host": host, "authorized": True, "rooms": len(rooms), "names": names}
+
+async def async_probe(hass: HomeAssistant, host: str, api_key: str, use_cache: bool = True) -> Dict[str, Any] | None:
+    cache = _cache(hass)
+    key = (host, api_key)
+    cached = cache.get(key)
+    if use_cache and cached is not None and cached[0] > time.monotonic():
+        return cached[1]
+    result = await _probe(async_get_clientsession(hass), host, api_key)
+    cache[key] = (time.monotonic() + PROBE_CACHE_SECONDS, result)
+    return result
+
+async def async_scan(hass: HomeAssistant, hosts: List[str], api_key: str) -> List[Dict[str, Any]]:
+    semaphore = asyncio.Semaphore(PROBE_CONCURRENCY)
+
+    async def _one(host: str) -> Dict[str, Any] | None:
+        async with semaphore:
+            return await async_probe(hass, host, api_key)
+
+    started = time.monotonic()
+    results = await asyncio.gather(*(_one(h) for h in hosts))
+    found = [r for r in results if r is not None]
+    _LOGGER.debug("veoovibes: scanned %d hosts in %.1fs, found %s", len(hosts), time.monotonic() - started, [r["host"] for r in found])
+    return found
@@ -0,0 +1,146 @@
+from __future__ import annotations
+import hashlib, json, logging
+from datetime import timedelta
+from typing import Any, Callable, Dict, List
+from homeassistant.components.media_player.browse_media import BrowseMedia, MediaClass
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.event import async_track_time_interval
+from .api import VeoovibesApi, VeoovibesError
+from .const import CTX_FAVORITE, FAV_REFRESH_SECONDS, FAV_PAGE_SIZE
+
+_LOGGER = logging.getLogger(__name__)
+
+FAVORITES_ID = "favorites"
+PAGE_PREFIX = "favorites:page:"
+SEARCH_PREFIX = "favorites:search:"
+MUSIC_TYPES = ("playlist", "spotify", "applemusic")
+
+def _version(raw: Dict[str, Any]) -> str:
+    return hashlib.sha1(json.dumps(raw, sort_keys=True, default=str).encode()).hexdigest()[:12]
+
+# Favorites catalog shared by all rooms of a controller. Refreshed on its own timer (not in the
+# polling loop), rebuilt only when the content hash changes, BrowseMedia nodes cached per version.
+class FavoritesStore:
+    def __init__(self, hass: HomeAssistant, api: VeoovibesApi) -> None:
+        self._hass = hass
+        self._api = api
+        self.raw: Dict[str, Any] = {}
+        self.version: str | None = None
+        self._etag: str | None = None
+        self._items: List[Dict[str, Any]] = []
+        self._browse: Dict[str, BrowseMedia] = {}
+        self.on_change: Callable[[], None] | None = None
+
+    def async_start(self) -> Callable[[], None]:
+        return async_track_time_interval(self._hass, self._async_tick, timedelta(seconds=FAV_REFRESH_SECONDS))
+
+    async def _async_tick(self, _now: Any) -> None:
+        await self.async_refresh()
+
+    async def async_refresh(self) -> bool:
+        try:
+            resp, self._etag = await self._api.list_favorites_conditional(self._etag)
+        except VeoovibesError as e:
+            _LOGGER.debug("list_favorites failed: %s", e)
+            return False
+        if resp is None:
+            return False
+        raw = resp.get("result") or {}
+        if not isinstance(raw, dict):
+            raw = {}
+        version = _version(raw)
+        if version == self.version:
+            return False
+        self._index(raw, version)
+        if self.on_change is not None:
+            self.on_change()
+        return True
+
+    def restore(self, raw: Dict[str, Any]) -> None:
+        # catalog from the persisted snapshot; no etag, so the next refresh fetches in full
+        if isinstance(raw, dict) and raw and self.version is None:
+            self._index(raw, _version(raw))
+
+    def _index(self, raw: Dict[str, Any], version: str) -> None:
+        items = []
+        for k, v in raw.items():
+            if not isinstance(v, dict):
+                continue
+            fav_id = v.get("favId") or k
+            title = v.get("name") or fav_id
+            items.append({
+                "id": fav_id,
+                "title": title,
+                "key": str(title).lower(),
+                "image": v.get("image"),
+                "music": (v.get("type") or "").lower() in MUSIC_TYPES,
+            })
+        items.sort(key=lambda x: x["key"])
+        self.raw = raw
+        self.version = version
+        self._items = items
+        self._browse = {}
+
+    # ---------- Browse ----------
+    def search(self, query: str) -> List[Dict[str, Any]]:
+        q = query.strip().lower()
+        return [item for item in self._items if q in item["key"]] if q else list(self._items)
+
+    def _child(self, item: Dict[str, Any]) -> BrowseMedia:
+        return BrowseMedia(
+            title=item["title"],
+            media_class=MediaClass.MUSIC if item["music"] else MediaClass.CHANNEL,
+            media_content_id=item["id"],
+            media_content_type=CTX_FAVORITE,
+            can_play=True,
+            can_expand=False,
+            thumbnail=item["image"],
+        )
+
+    def _directory(self, title: str, content_id: str, children: List[BrowseMedia] | None = None) -> BrowseMedia:
+        return BrowseMedia(
+            title=title,
+            media_class=MediaClass.DIRECTORY,
+            media_content_id=content_id,
+            media_content_type=CTX_FAVORITE,
+            can_play=False,
+            can_expand=True,
+            children=children,
+        )
+
+    def _page_title(self, page: int) -> str:
+        first = self._items[page * FAV_PAGE_SIZE]["title"]
+        last = self._items[min(len(self._items), (page + 1) * FAV_PAGE_SIZE) - 1]["title"]
+        return f"{first} – {last}"
+
+    def browse(self, content_id: str = FAVORITES_ID) -> BrowseMedia:
+        if content_id.startswith(SEARCH_PREFIX):
+            query = content_id[len(SEARCH_PREFIX):]
+            hits = self.search(query)[:FAV_PAGE_SIZE]
+            return self._directory(f"Favoriten: {query}", content_id, [self._child(i) for i in hits])
+
+        if not content_id.startswith(PAGE_PREFIX):
+            content_id = FAVORITES_ID
+        node = self._browse.get(content_id)
+        if node is not None:
+            return node
+
+        pages = (len(self._items) + FAV_PAGE_SIZE - 1) // FAV_PAGE_SIZE
+        if content_id.startswith(PAGE_PREFIX):
+            try:
+                page = int(content_id[len(PAGE_PREFIX):])
+            except ValueError:
+                page = 0
+            page = max(0, min(page, pages - 1)) if pages else 0
+            items = self._items[page * FAV_PAGE_SIZE:(page + 1) * FAV_PAGE_SIZE]
+            node = self._directory(self._page_title(page) if items else "Favoriten", content_id, [self._child(i) for i in items])
+        elif pages > 1:
+            node = self._directory(
+                "Favoriten",
+                FAVORITES_ID,
+                [self._directory(self._page_title(p), f"{PAGE_PREFIX}{p}") for p in range(pages)],
+            )
+        else:
+            node = self._directory("Favoriten", FAVORITES_ID, [self._child(i) for i in self._items])
+        self._browse[content_id] = node
+        return node
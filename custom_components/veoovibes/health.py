@@ -0,0 +1,65 @@
+from __future__ import annotations
+import random
+from typing import Any, Dict, Iterable, List
+from .const import ROOM_FAILURE_THRESHOLD, ROOM_PROBE_MAX_INTERVAL
+
+# Per-room health: a room whose player status fails keeps its last known state (stale), leaves the
+# sweep and is re-probed in the background with its own exponential back-off; after
+# ROOM_FAILURE_THRESHOLD consecutive failures it is reported unavailable.
+class RoomHealth:
+    def __init__(self, base_interval: float, max_interval: float = ROOM_PROBE_MAX_INTERVAL, threshold: int = ROOM_FAILURE_THRESHOLD) -> None:
+        self._base = max(1.0, float(base_interval))
+        self._max = max(self._base, float(max_interval))
+        self._threshold = max(1, int(threshold))
+        self._failures: Dict[str, int] = {}
+        self._next_probe: Dict[str, float] = {}
+        self._probing: set[str] = set()
+
+    def healthy(self, rid: str) -> bool:
+        return rid not in self._failures
+
+    def flags(self, rid: str) -> tuple[bool, bool]:
+        # (stale, reachable)
+        n = self._failures.get(rid, 0)
+        return n > 0, n < self._threshold
+
+    # returns True when the room recovered
+    def record_success(self, rid: str) -> bool:
+        self._next_probe.pop(rid, None)
+        return self._failures.pop(rid, None) is not None
+
+    def record_failure(self, rid: str, now: float) -> None:
+        n = self._failures[rid] = self._failures.get(rid, 0) + 1
+        delay = min(self._max, self._base * 2 ** (n - 1))
+        self._next_probe[rid] = now + delay * random.uniform(0.8, 1.2)
+
+    def probes_due(self, now: float) -> List[str]:
+        due = [rid for rid, t in self._next_probe.items() if t <= now and rid not in self._probing]
+        self._probing.update(due)
+        return due
+
+    def probing(self, rid: str) -> bool:
+        return rid in self._probing
+
+    def start_probe(self, rid: str) -> None:
+        self._probing.add(rid)
+
+    def probe_done(self, rid: str) -> None:
+        self._probing.discard(rid)
+
+    def sync_rooms(self, rids: Iterable[str]) -> None:
+        keep = set(rids)
+        for rid in [r for r in self._failures if r not in keep]:
+            self._failures.pop(rid, None)
+            self._next_probe.pop(rid, None)
+        self._probing &= keep
+
+    def diagnostics(self, now: float) -> Dict[str, Any]:
+        return {
+            rid: {
+                "failures": n,
+                "reachable": n < self._threshold,
+                "next_probe_in": round(max(0.0, self._next_probe.get(rid, now) - now), 1),
+            }
+            for rid, n in self._failures.items()
+        }
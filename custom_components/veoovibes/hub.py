@@ -0,0 +1,157 @@
+from __future__ import annotations
+import asyncio, logging, time
+from typing import Any, Dict, List
+import aiohttp
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant
+from .const import (
+    DOMAIN,
+    HUB_TICK,
+    GLOBAL_CONNECTION_LIMIT,
+    GLOBAL_REQUEST_BUDGET,
+    GLOBAL_REQUEST_BURST,
+    MAX_PARALLEL_LIMIT,
+)
+from .coordinator import VeoovibesCoordinator
+from .transport import create_session
+
+_LOGGER = logging.getLogger(__name__)
+
+HUB_KEY = "hub"
+
+# Token bucket shared by every controller's transport.
+class RequestBudget:
+    def __init__(self, rate: float = GLOBAL_REQUEST_BUDGET, burst: float = GLOBAL_REQUEST_BURST) -> None:
+        self._rate = float(rate)
+        self._burst = float(burst)
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self.waits = 0
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        self._refill()
+        while self._tokens < 1.0:
+            self.waits += 1
+            await asyncio.sleep((1.0 - self._tokens) / self._rate)
+            self._refill()
+        self._tokens -= 1.0
+
+    def diagnostics(self) -> Dict[str, Any]:
+        self._refill()
+        return {"rate": self._rate, "burst": self._burst, "tokens": round(self._tokens, 2), "waits": self.waits}
+
+# Domain-level scheduler: owns the shared session and request budget and runs every controller's
+# sweep from one loop, spreading them evenly across each tick instead of letting them burst together.
+class VeoovibesHub:
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._hass = hass
+        # per-controller parallelism is enforced by each transport's semaphore
+        self.session: aiohttp.ClientSession = create_session(limit_per_host=MAX_PARALLEL_LIMIT, limit=GLOBAL_CONNECTION_LIMIT)
+        self.budget = RequestBudget()
+        self._members: set[str] = set()
+        self._coordinators: Dict[str, VeoovibesCoordinator] = {}
+        self._last: Dict[str, float] = {}
+        self._running: Dict[str, asyncio.Task] = {}
+        self._loop_task: asyncio.Task | None = None
+        self.overruns = 0
+        # config entries are not unloaded on shutdown, so the session is also closed with Home Assistant
+        self._unsub_close: CALLBACK_TYPE | None = hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, self._async_on_close)
+
+    # an entry holds the shared session from setup start, before its coordinator is scheduled
+    def attach(self, entry_id: str) -> None:
+        self._members.add(entry_id)
+
+    def register(self, entry_id: str, coordinator: VeoovibesCoordinator) -> None:
+        self._members.add(entry_id)
+        self._coordinators[entry_id] = coordinator
+        self._last[entry_id] = time.monotonic()
+        if self._loop_task is None:
+            self._loop_task = self._hass.async_create_background_task(self._async_run(), f"{DOMAIN} hub scheduler")
+
+    # returns True when the last controller left and the hub was closed
+    async def async_unregister(self, entry_id: str) -> bool:
+        self._members.discard(entry_id)
+        self._coordinators.pop(entry_id, None)
+        self._last.pop(entry_id, None)
+        task = self._running.pop(entry_id, None)
+        if task is not None:
+            task.cancel()
+        if self._members:
+            return False
+        if self._unsub_close is not None:
+            self._unsub_close()
+            self._unsub_close = None
+        await self._async_close()
+        return True
+
+    async def _async_on_close(self, event: Event) -> None:
+        self._unsub_close = None
+        await self._async_close()
+
+    async def _async_close(self) -> None:
+        if self._loop_task is not None:
+            self._loop_task.cancel()
+            self._loop_task = None
+        for task in self._running.values():
+            task.cancel()
+        await self.session.close()
+
+    async def _async_refresh(self, entry_id: str, coordinator: VeoovibesCoordinator) -> None:
+        try:
+            await coordinator.async_refresh()
+        finally:
+            self._running.pop(entry_id, None)
+
+    async def _async_run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            entries: List[str] = list(self._coordinators)
+            for i, entry_id in enumerate(entries):
+                delay = start + i * HUB_TICK / len(entries) - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                coordinator = self._coordinators.get(entry_id)
+                if coordinator is None:
+                    continue
+                now = time.monotonic()
+                # half a tick of slack so the stagger offset doesn't push a controller to the next tick
+                if now - self._last.get(entry_id, 0.0) + HUB_TICK / 2 < coordinator.scheduler.fast_interval:
+                    continue
+                if entry_id in self._running:
+                    self.overruns += 1
+                    continue
+                self._last[entry_id] = now
+                self._running[entry_id] = self._hass.async_create_background_task(
+                    self._async_refresh(entry_id, coordinator), f"{DOMAIN} refresh {coordinator.api.host}"
+                )
+            await asyncio.sleep(max(0.0, start + HUB_TICK - loop.time()))
+
+    def diagnostics(self) -> Dict[str, Any]:
+        return {
+            "controllers": len(self._coordinators),
+            "members": len(self._members),
+            "tick": HUB_TICK,
+            "overruns": self.overruns,
+            "budget": self.budget.diagnostics(),
+        }
+
+def async_get_hub(hass: HomeAssistant, entry_id: str | None = None) -> VeoovibesHub:
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    hub = domain_data.get(HUB_KEY)
+    if hub is None:
+        hub = domain_data[HUB_KEY] = VeoovibesHub(hass)
+    if entry_id is not None:
+        hub.attach(entry_id)
+    return hub
+
+async def async_release_hub(hass: HomeAssistant, entry_id: str) -> None:
+    domain_data = hass.data.get(DOMAIN) or {}
+    hub = domain_data.get(HUB_KEY)
+    if hub is not None and await hub.async_unregister(entry_id):
+        domain_data.pop(HUB_KEY, None)
@@ -1,5 +1,6 @@
 from __future__ import annotations
-import logging, hashlib
+import logging
+from datetime import datetime
 from typing import Any, Optional
 from homeassistant.components.media_player import MediaPlayerEntity
 from homeassistant.components.media_player.const import MediaPlayerEntityFeature, MediaPlayerState
@@ -9,13 +10,16 @@ from homeassistant.components.media_player.browse_media import (
     MediaType,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback, async_get_current_platform
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, CTX_FAVORITE
+from .const import DOMAIN, CTX_FAVORITE, VOLUME_DEBOUNCE
 from .coordinator import VeoovibesCoordinator
+from .model import RoomState
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -28,6 +32,7 @@ BASE_FEATURES = (
     | MediaPlayerEntityFeature.VOLUME_STEP
     | MediaPlayerEntityFeature.BROWSE_MEDIA
     | MediaPlayerEntityFeature.PLAY_MEDIA
+    | MediaPlayerEntityFeature.GROUPING
 )
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback) -> None:
@@ -35,11 +40,30 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     coord: VeoovibesCoordinator = data["coordinator"]
     api = data["api"]
 
+    host = api.host
     rooms = coord.data.get("rooms", {}) or {}
-    entities = []
-    for rid, rinfo in rooms.items():
-        entities.append(VeoovibesRoom(api, coord, rid, rinfo, host=data["api"].host))
-    async_add_entities(entities)
+    entities: dict[str, VeoovibesRoom] = {}
+    for rid, room in rooms.items():
+        entities[rid] = VeoovibesRoom(api, coord, rid, room.name, host=host)
+    async_add_entities(list(entities.values()))
+
+    # a room gone from the controller only loses its entity; the registry entries keep their names and
+    # areas in case it comes back, and can be deleted from the device page (async_remove_config_entry_device)
+    async def _async_remove_room(rid: str) -> None:
+        entity = entities.pop(rid, None)
+        if entity is not None:
+            await entity.async_remove(force_remove=True)
+
+    @callback
+    def _async_rooms_changed(added: dict[str, str], removed: list[str]) -> None:
+        new = {rid: VeoovibesRoom(api, coord, rid, name, host=host) for rid, name in added.items() if rid not in entities}
+        if new:
+            entities.update(new)
+            async_add_entities(list(new.values()))
+        for rid in removed:
+            hass.async_create_task(_async_remove_room(rid))
+
+    entry.async_on_unload(async_dispatcher_connect(hass, coord.rooms_signal, _async_rooms_changed))
 
     platform = async_get_current_platform()
     platform.async_register_entity_service(
@@ -53,17 +77,26 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
 class VeoovibesRoom(CoordinatorEntity[VeoovibesCoordinator], MediaPlayerEntity):
     _attr_has_entity_name = False  # explicit friendly name
     _attr_device_class = "speaker"
+    _attr_media_image_remotely_accessible = False
 
-    def __init__(self, api, coordinator: VeoovibesCoordinator, room_id: str, room_info: dict[str, Any], host: str):
-        super().__init__(coordinator)
-        self.api = api
+    def __init__(self, api, coordinator: VeoovibesCoordinator, room_id: str, room_name: str, host: str):
         self._room_id = str(room_id)
-        self._room_name = room_info.get("name") or room_info.get("api_room_name") or f"Room {room_id}"
+        super().__init__(coordinator, context=self._room_id)
+        self.api = api
+        self._room_name = room_name
         self._friendly = f"veoovibes – {self._room_name}"
         self._attr_unique_id = f"veoovibes_room_{self._room_id}"
         self._attr_name = self._friendly
         self._attr_supported_features = BASE_FEATURES
         self._host = host
+        self._pending_volume: Optional[int] = None
+        self._volume_debouncer = Debouncer(
+            coordinator.hass,
+            _LOGGER,
+            cooldown=VOLUME_DEBOUNCE,
+            immediate=True,
+            function=self._async_send_volume,
+        )
 
     @property
     def device_info(self) -> DeviceInfo:
@@ -76,151 +109,155 @@ class VeoovibesRoom(CoordinatorEntity[VeoovibesCoordinator], MediaPlayerEntity):
         )
 
     # ---------- Helpers ----------
-    def _rooms(self) -> dict[str, Any]:
-        return self.coordinator.data.get("rooms", {}) or {}
-
-    def _rp(self) -> dict[str, Any]:
-        return (self.coordinator.data.get("room_status", {}) or {}).get(self._room_id, {})
-
-    def _fb_text(self) -> dict[str, Any]:
-        fb = self.coordinator.data.get("feedback", {}) or {}
-        ptext = {}
-        for e in fb.get("playertext", []) or []:
-            ptext[str(e.get("roomid"))] = e
-        return ptext.get(self._room_id, {})
-
-    def _fb_vol(self) -> Optional[int]:
-        fb = self.coordinator.data.get("feedback", {}) or {}
-        for e in fb.get("roomvolume", []) or []:
-            if str(e.get("roomid")) == self._room_id:
-                try:
-                    return int(e.get("roomvol"))
-                except Exception:
-                    return None
-        return None
-
-    def _fb_is_playing(self) -> bool:
-        t = self._fb_text()
-        for k in ("roomtext", "roomtitle", "roomartist", "roomalbum"):
-            v = t.get(k)
-            if isinstance(v, str) and v.strip():
-                return True
-        return False
+    @property
+    def _room(self) -> RoomState | None:
+        return self.coordinator.data["rooms"].get(self._room_id)
 
     # ---------- Core state ----------
     @property
     def available(self) -> bool:
-        r = self._rooms().get(self._room_id) or {}
-        return bool(r.get("is_available", True))
+        room = self._room
+        return room is not None and room.available
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        # last known state is kept while the room's player status fails
+        room = self._room
+        return {"stale": True} if room is not None and room.stale else None
 
     @property
     def state(self) -> Optional[str]:
-        p = self._rp()
-        status_code = (p.get("status_code") or "").lower()
-        is_playing_flag = str(p.get("is_playing", "0")).lower() in ("1", "true", "yes")
-
-        if status_code == "playing" or is_playing_flag:
-            return MediaPlayerState.PLAYING
-        if status_code in ("paused", "pause"):
-            return MediaPlayerState.IDLE
-        if self._fb_is_playing():
-            return MediaPlayerState.PLAYING
-        if status_code in ("stopped", "stop"):
-            return MediaPlayerState.IDLE
-        return MediaPlayerState.IDLE
-
-    def _clean(self, s: Optional[str]) -> Optional[str]:
-        if isinstance(s, str) and s.strip():
-            return s.strip()
-        return None
+        room = self._room
+        return room.state if room is not None else MediaPlayerState.IDLE
 
     @property
     def media_title(self) -> Optional[str]:
-        p = self._rp()
-        fb = self._fb_text()
-        return self._clean(fb.get("roomtext")) or self._clean(p.get("title")) or self._clean(fb.get("roomtitle"))
+        room = self._room
+        return room.title if room is not None else None
 
     @property
     def media_artist(self) -> Optional[str]:
-        p = self._rp()
-        fb = self._fb_text()
-        return self._clean(p.get("artist")) or self._clean(fb.get("roomartist"))
+        room = self._room
+        return room.artist if room is not None else None
 
     @property
     def media_album_name(self) -> Optional[str]:
-        p = self._rp()
-        fb = self._fb_text()
-        return self._clean(p.get("album")) or self._clean(fb.get("roomalbum"))
+        room = self._room
+        return room.album if room is not None else None
+
+    # position is reported with a reference timestamp; HA interpolates it while playing
+    @property
+    def media_position(self) -> Optional[float]:
+        room = self._room
+        return room.position if room is not None else None
+
+    @property
+    def media_duration(self) -> Optional[float]:
+        room = self._room
+        return room.duration if room is not None else None
+
+    @property
+    def media_position_updated_at(self) -> Optional[datetime]:
+        room = self._room
+        return room.position_updated_at if room is not None else None
 
     @property
     def media_content_type(self) -> Optional[str]:
         return "music"
 
-    def _cover(self) -> Optional[str]:
-        p = self._rp()
-        c = p.get("cover")
-        return self._clean(c)
-
-    def _meta_hash(self) -> str:
-        t = self.media_title or ""
-        a = self.media_artist or ""
-        b = self.media_album_name or ""
-        base = f"{t}|{a}|{b}".encode("utf-8", "ignore")
-        return hashlib.sha1(base).hexdigest()[:8]
+    # Covers are served through HA's media player proxy from a per-controller cache,
+    # so the frontend only refetches when the cover token changes.
+    @property
+    def media_image_url(self) -> Optional[str]:
+        room = self._room
+        return room.cover if room is not None else None
 
     @property
-    def entity_picture(self) -> Optional[str]:
-        url = self._cover()
-        if not url:
-            return None
-        sep = "&" if "?" in url else "?"
-        return f"{url}{sep}cache={self._meta_hash()}"
+    def media_image_hash(self) -> Optional[str]:
+        room = self._room
+        return room.cover_token if room is not None and room.cover else None
+
+    async def async_get_media_image(self) -> tuple[bytes | None, str | None]:
+        return await self.coordinator.async_get_cover(self._room_id)
 
     @property
     def volume_level(self) -> Optional[float]:
-        p = self._rp()
-        vol = p.get("current_volume")
-        if vol is None:
-            vol = self._fb_vol()
-        try:
-            return max(0.0, min(1.0, float(vol) / 100.0)) if vol is not None else None
-        except Exception:
-            return None
+        room = self._room
+        return room.volume if room is not None else None
 
     # ---------- Controls ----------
+    # Commands go to every room of this room's zone through the coordinator's batcher, which
+    # boosts the rooms and follows up with one consolidated refresh.
+    async def _async_command(self, command: str, *args: Any, **optimistic: Any) -> None:
+        rooms = self.coordinator.group_rooms(self._room_id)
+        await self.coordinator.commands.async_send(command, rooms, *args)
+        if optimistic:
+            for rid in rooms:
+                self.coordinator.async_apply_optimistic(rid, **optimistic)
+
     async def async_media_play(self) -> None:
-        await self.api.room_play(self._room_id)
-        await self.coordinator.async_request_refresh()
+        await self._async_command("room_play", state=MediaPlayerState.PLAYING)
 
     async def async_media_stop(self) -> None:
-        await self.api.room_stop(self._room_id)
-        await self.coordinator.async_request_refresh()
+        await self._async_command("room_stop", state=MediaPlayerState.IDLE)
 
     async def async_media_next_track(self) -> None:
-        await self.api.room_next(self._room_id)
-        await self.coordinator.async_request_refresh()
+        await self._async_command("room_next")
 
     async def async_media_previous_track(self) -> None:
-        await self.api.room_prev(self._room_id)
-        await self.coordinator.async_request_refresh()
+        await self._async_command("room_prev")
 
     async def async_volume_up(self) -> None:
-        await self.api.room_vol_up(self._room_id)
-        await self.coordinator.async_request_refresh()
+        await self._async_command("room_vol_up")
 
     async def async_volume_down(self) -> None:
-        await self.api.room_vol_down(self._room_id)
-        await self.coordinator.async_request_refresh()
+        await self._async_command("room_vol_down")
 
     async def async_set_volume_level(self, volume: float) -> None:
-        vol = max(0, min(100, int(round(volume * 100))))
-        await self.api.room_vol_set(self._room_id, vol)
-        await self.coordinator.async_request_refresh()
+        # slider drags: show the value right away, send only the latest one per debounce window
+        self._pending_volume = max(0, min(100, int(round(volume * 100))))
+        for rid in self.coordinator.group_rooms(self._room_id):
+            self.coordinator.async_apply_optimistic(rid, volume=self._pending_volume / 100.0)
+        await self._volume_debouncer.async_call()
+
+    async def _async_send_volume(self) -> None:
+        vol = self._pending_volume
+        if vol is None:
+            return
+        self._pending_volume = None
+        await self._async_command("room_vol_set", vol)
+
+    # ---------- Zones ----------
+    @property
+    def group_members(self) -> list[str] | None:
+        rooms = self.coordinator.group_rooms(self._room_id)
+        if len(rooms) < 2:
+            return None
+        return [eid for rid in rooms if (eid := self.coordinator.entity_ids.get(rid))]
+
+    async def async_join_players(self, group_members: list[str]) -> None:
+        rooms = {eid: rid for rid, eid in self.coordinator.entity_ids.items()}
+        unknown = [eid for eid in group_members if eid not in rooms]
+        if unknown:
+            _LOGGER.warning("veoovibes: cannot join %s, only rooms of the same controller can form a zone", unknown)
+        self.coordinator.async_join(self._room_id, [rooms[eid] for eid in group_members if eid in rooms])
+
+    async def async_unjoin_player(self) -> None:
+        self.coordinator.async_unjoin(self._room_id)
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self.coordinator.entity_ids[self._room_id] = self.entity_id
+
+    async def async_will_remove_from_hass(self) -> None:
+        self._volume_debouncer.async_cancel()
+        self.coordinator.async_unjoin(self._room_id)
+        self.coordinator.entity_ids.pop(self._room_id, None)
+        await super().async_will_remove_from_hass()
 
     # ---------- Favorites ----------
     async def async_play_favorite(self, fav_id: str) -> None:
-        await self.api.play_favorite(self._room_id, fav_id)
-        await self.coordinator.async_request_refresh()
+        await self._async_command("play_favorite", fav_id, state=MediaPlayerState.PLAYING)
 
     async def async_browse_media(self, media_content_type=None, media_content_id=None) -> BrowseMedia:
         # Root for this room
@@ -246,37 +283,9 @@ class VeoovibesRoom(CoordinatorEntity[VeoovibesCoordinator], MediaPlayerEntity):
             )
             return root
 
-        # Favorites list
+        # Favorites list (shared, pre-sorted catalog; pages/search by content id)
         if media_content_type == CTX_FAVORITE:
-            favs = (self.coordinator.data.get("favorites") or {}) if self.coordinator.data else {}
-            children = []
-            # result is dict keyed by favId-like keys
-            for k, v in favs.items():
-                fav_id = v.get("favId") or k
-                title = v.get("name") or fav_id
-                image = v.get("image")
-                mclass = MediaClass.MUSIC if (v.get("type") or "").lower() in ("playlist", "spotify", "applemusic") else MediaClass.CHANNEL
-                child = BrowseMedia(
-                    title=title,
-                    media_class=mclass,
-                    media_content_id=fav_id,
-                    media_content_type=CTX_FAVORITE,
-                    can_play=True,
-                    can_expand=False,
-                    thumbnail=image,
-                )
-                children.append(child)
-            # Sort by title
-            children.sort(key=lambda x: (x.title or "").lower())
-            return BrowseMedia(
-                title="Favoriten",
-                media_class=MediaClass.DIRECTORY,
-                media_content_id="favorites",
-                media_content_type=CTX_FAVORITE,
-                can_play=False,
-                can_expand=True,
-                children=children,
-            )
+            return self.coordinator.favorites.browse(media_content_id or "favorites")
 
         # Fallback
         return BrowseMedia(
@@ -0,0 +1,109 @@
+from __future__ import annotations
+import time
+from bisect import bisect_left
+from typing import Any, Dict, List
+
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)  # seconds, upper bounds
+
+class EndpointStats:
+    __slots__ = ("requests", "errors", "timeouts", "total_time", "max_time", "buckets")
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.buckets: List[int] = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    def as_dict(self) -> Dict[str, Any]:
+        labels = [f"le_{b}" for b in LATENCY_BUCKETS] + ["le_inf"]
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "error_rate": round(self.errors / self.requests, 4) if self.requests else 0.0,
+            "timeout_rate": round(self.timeouts / self.requests, 4) if self.requests else 0.0,
+            "avg_ms": round(self.total_time / self.requests * 1000, 1) if self.requests else None,
+            "max_ms": round(self.max_time * 1000, 1),
+            "histogram": dict(zip(labels, self.buckets)),
+        }
+
+# Hot-path counters for one controller; recording is a few integer ops per request/refresh.
+class Metrics:
+    def __init__(self) -> None:
+        self.started = time.monotonic()
+        self.endpoints: Dict[str, EndpointStats] = {}
+        self.refreshes = 0
+        self.refresh_failures = 0
+        self.last_refresh_duration: float | None = None
+        self.max_refresh_duration = 0.0
+        self.total_refresh_time = 0.0
+        self.last_polled_rooms = 0
+        self.last_failed_rooms = 0
+        self.last_skipped_rooms = 0
+        self.failed_rooms_total = 0
+        self.last_success: float | None = None
+
+    def record_request(self, endpoint: str, duration: float, error: str | None = None) -> None:
+        st = self.endpoints.get(endpoint)
+        if st is None:
+            st = self.endpoints[endpoint] = EndpointStats()
+        st.requests += 1
+        st.total_time += duration
+        if duration > st.max_time:
+            st.max_time = duration
+        st.buckets[bisect_left(LATENCY_BUCKETS, duration)] += 1
+        if error == "timeout":
+            st.timeouts += 1
+        elif error is not None:
+            st.errors += 1
+
+    def record_refresh(self, duration: float, ok: bool, polled: int = 0, failed: int = 0, skipped: int = 0) -> None:
+        self.refreshes += 1
+        self.last_refresh_duration = duration
+        self.total_refresh_time += duration
+        if duration > self.max_refresh_duration:
+            self.max_refresh_duration = duration
+        if not ok:
+            self.refresh_failures += 1
+            return
+        self.last_success = time.monotonic()
+        self.last_polled_rooms = polled
+        self.last_failed_rooms = failed
+        self.last_skipped_rooms = skipped
+        self.failed_rooms_total += failed
+
+    @property
+    def total_requests(self) -> int:
+        return sum(st.requests for st in self.endpoints.values())
+
+    @property
+    def total_errors(self) -> int:
+        return sum(st.errors + st.timeouts for st in self.endpoints.values())
+
+    @property
+    def stale_age(self) -> float | None:
+        return round(time.monotonic() - self.last_success, 1) if self.last_success is not None else None
+
+    def as_dict(self) -> Dict[str, Any]:
+        uptime = max(1.0, time.monotonic() - self.started)
+        return {
+            "uptime": round(uptime, 1),
+            "requests_total": self.total_requests,
+            "requests_per_minute": round(self.total_requests / uptime * 60, 1),
+            "errors_total": self.total_errors,
+            "endpoints": {name: st.as_dict() for name, st in self.endpoints.items()},
+            "refresh": {
+                "count": self.refreshes,
+                "failures": self.refresh_failures,
+                "last_ms": round(self.last_refresh_duration * 1000, 1) if self.last_refresh_duration is not None else None,
+                "avg_ms": round(self.total_refresh_time / self.refreshes * 1000, 1) if self.refreshes else None,
+                "max_ms": round(self.max_refresh_duration * 1000, 1),
+                "last_polled_rooms": self.last_polled_rooms,
+                "last_failed_rooms": self.last_failed_rooms,
+                "last_skipped_rooms": self.last_skipped_rooms,
+                "failed_rooms_total": self.failed_rooms_total,
+            },
+            "stale_age": self.stale_age,
+        }
@@ -0,0 +1,192 @@
+from __future__ import annotations
+import hashlib
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+from homeassistant.components.media_player.const import MediaPlayerState
+from homeassistant.util import dt as dt_util
+from .const import POSITION_DRIFT
+
+def _clean(s: Any) -> Optional[str]:
+    if isinstance(s, str) and s.strip():
+        return s.strip()
+    return None
+
+def _seconds(v: Any) -> Optional[float]:
+    # plain seconds or "m:ss" / "h:mm:ss"
+    if isinstance(v, bool) or v is None:
+        return None
+    if isinstance(v, (int, float)):
+        return float(v) if v >= 0 else None
+    if not isinstance(v, str) or not v.strip():
+        return None
+    try:
+        if ":" in v:
+            total = 0.0
+            for part in v.strip().split(":"):
+                total = total * 60 + float(part)
+            return total
+        value = float(v)
+    except ValueError:
+        return None
+    return value if value >= 0 else None
+
+def _first(status: Dict[str, Any], keys: tuple) -> Optional[float]:
+    for k in keys:
+        value = _seconds(status.get(k))
+        if value is not None:
+            return value
+    return None
+
+# Parsed per-room state, built once per refresh. Instances are immutable by convention: a room whose
+# parsed values did not change keeps the very same object between ticks.
+class RoomState:
+    __slots__ = (
+        "room_id", "name", "available", "state", "title", "artist", "album", "volume", "cover", "cover_token",
+        "position", "duration", "position_updated_at", "stale",
+    )
+
+    def __init__(
+        self,
+        room_id: str,
+        name: str,
+        available: bool = True,
+        state: str = MediaPlayerState.IDLE,
+        title: Optional[str] = None,
+        artist: Optional[str] = None,
+        album: Optional[str] = None,
+        volume: Optional[float] = None,
+        cover: Optional[str] = None,
+        cover_token: Optional[str] = None,
+        position: Optional[float] = None,
+        duration: Optional[float] = None,
+        position_updated_at: Optional[datetime] = None,
+        stale: bool = False,
+    ) -> None:
+        self.room_id = room_id
+        self.name = name
+        self.available = available
+        self.state = state
+        self.title = title
+        self.artist = artist
+        self.album = album
+        self.volume = volume
+        self.cover = cover
+        self.cover_token = cover_token
+        self.position = position
+        self.duration = duration
+        self.position_updated_at = position_updated_at
+        self.stale = stale
+
+    def _values(self) -> tuple:
+        return tuple(getattr(self, k) for k in self.__slots__)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, RoomState) and self._values() == other._values()
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"RoomState({', '.join(f'{k}={getattr(self, k)!r}' for k in self.__slots__)})"
+
+    @property
+    def is_playing(self) -> bool:
+        return self.state == MediaPlayerState.PLAYING
+
+    def replace(self, **changes: Any) -> RoomState:
+        values = {k: getattr(self, k) for k in self.__slots__}
+        values.update(changes)
+        return RoomState(**values)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {k: getattr(self, k) for k in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> RoomState:
+        values = {k: data[k] for k in cls.__slots__ if k in data}
+        if isinstance(values.get("position_updated_at"), str):
+            values["position_updated_at"] = dt_util.parse_datetime(values["position_updated_at"])
+        return cls(**values)
+
+def build_room_state(
+    room_id: str,
+    info: Dict[str, Any],
+    status: Dict[str, Any],
+    fb_text: Dict[str, Any],
+    fb_vol: Dict[str, Any],
+    prev: RoomState | None = None,
+    status_age: float = 0.0,
+    stale: bool = False,
+    reachable: bool = True,
+) -> RoomState:
+    status_code = (status.get("status_code") or "").lower()
+    is_playing_flag = str(status.get("is_playing", "0")).lower() in ("1", "true", "yes")
+    fb_playing = any(_clean(fb_text.get(k)) for k in ("roomtext", "roomtitle", "roomartist", "roomalbum"))
+
+    if status_code == "playing" or is_playing_flag:
+        state = MediaPlayerState.PLAYING
+    elif status_code in ("paused", "pause"):
+        state = MediaPlayerState.IDLE
+    elif fb_playing:
+        state = MediaPlayerState.PLAYING
+    else:
+        state = MediaPlayerState.IDLE
+
+    vol = fb_vol.get("roomvol")
+    if vol is None:
+        vol = status.get("current_volume")
+    try:
+        volume = max(0.0, min(1.0, float(vol) / 100.0)) if vol is not None else None
+    except (TypeError, ValueError):
+        volume = None
+
+    title = _clean(fb_text.get("roomtext")) or _clean(status.get("title")) or _clean(fb_text.get("roomtitle"))
+    artist = _clean(status.get("artist")) or _clean(fb_text.get("roomartist"))
+    album = _clean(status.get("album")) or _clean(fb_text.get("roomalbum"))
+    cover = _clean(status.get("cover"))
+
+    # cache-busting token for the cover only changes with the metadata
+    if prev is not None and (prev.title, prev.artist, prev.album, prev.cover) == (title, artist, album, cover):
+        cover_token = prev.cover_token
+    else:
+        base = f"{title or ''}|{artist or ''}|{album or ''}|{cover or ''}".encode("utf-8", "ignore")
+        cover_token = hashlib.sha1(base).hexdigest()[:8]
+
+    # position as reported `status_age` seconds ago; HA interpolates from position_updated_at, so the
+    # previous reference is kept unless state or track changed or the reported position drifted (seek)
+    duration = _first(status, ("duration", "length", "total_time"))
+    position = _first(status, ("position", "elapsed", "current_position"))
+    now = dt_util.utcnow()
+    if position is None:
+        position_updated_at = None
+    else:
+        playing = state == MediaPlayerState.PLAYING
+        reported = position + (status_age if playing else 0.0)
+        position_updated_at = now - timedelta(seconds=status_age if playing else 0.0)
+        if (
+            prev is not None
+            and prev.position is not None
+            and prev.position_updated_at is not None
+            and (prev.state, prev.title, prev.artist, prev.album) == (state, title, artist, album)
+        ):
+            expected = prev.position + ((now - prev.position_updated_at).total_seconds() if playing else 0.0)
+            if abs(expected - reported) <= POSITION_DRIFT:
+                position, position_updated_at = prev.position, prev.position_updated_at
+
+    new = RoomState(
+        room_id,
+        info.get("name") or info.get("api_room_name") or f"Room {room_id}",
+        bool(info.get("is_available", True)) and reachable,
+        state,
+        title,
+        artist,
+        album,
+        volume,
+        cover,
+        cover_token,
+        position,
+        duration,
+        position_updated_at,
+        stale,
+    )
+    # structural sharing: unchanged rooms keep their previous object
+    return prev if prev is not None and prev == new else new
@@ -0,0 +1,61 @@
+from __future__ import annotations
+import logging
+from typing import Any
+from aiohttp import web
+from homeassistant.components import webhook
+from homeassistant.core import HomeAssistant, callback
+from .const import DOMAIN
+from .coordinator import VeoovibesCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+def _payload_error(payload: Any) -> str | None:
+    # validated up front: the coordinator clears per-room caches before merging
+    if not isinstance(payload, dict):
+        return "expected object"
+    feedback = payload.get("result") if isinstance(payload.get("result"), dict) else payload
+    for key in ("playertext", "roomvolume"):
+        entries = feedback.get(key)
+        if entries is None:
+            continue
+        if not isinstance(entries, list) or not all(isinstance(e, dict) and e.get("roomid") is not None for e in entries):
+            return f"{key} must be a list of objects with roomid"
+    rooms = feedback.get("rooms")
+    if rooms is not None and (not isinstance(rooms, list) or not all(isinstance(r, (str, int)) for r in rooms)):
+        return "rooms must be a list of room ids"
+    status = feedback.get("room_status")
+    if status is not None and not isinstance(status, dict):
+        return "room_status must be an object"
+    return None
+
+# Push receiver: the controller (or a bridge on it) POSTs get_room_feedback-shaped JSON
+# ({"playertext": [...], "roomvolume": [...], optional "room_status": {rid: {...}}})
+# to the webhook; the coordinator merges it and slows polling while pushes keep arriving.
+class VeoovibesPushReceiver:
+    def __init__(self, hass: HomeAssistant, coordinator: VeoovibesCoordinator, webhook_id: str) -> None:
+        self._hass = hass
+        self._coordinator = coordinator
+        self.webhook_id = webhook_id
+
+    @property
+    def url(self) -> str:
+        return webhook.async_generate_url(self._hass, self.webhook_id)
+
+    @callback
+    def async_register(self, name: str) -> None:
+        webhook.async_register(self._hass, DOMAIN, name, self.webhook_id, self._async_handle, local_only=True)
+        _LOGGER.info("veoovibes push receiver for %s listening at %s", self._coordinator.api.host, self.url)
+
+    @callback
+    def async_unregister(self) -> None:
+        webhook.async_unregister(self._hass, self.webhook_id)
+
+    async def _async_handle(self, hass: HomeAssistant, webhook_id: str, request: web.Request) -> web.Response | None:
+        try:
+            payload: Any = await request.json()
+        except ValueError:
+            return web.Response(status=400, text="invalid json")
+        if (error := _payload_error(payload)) is not None:
+            return web.Response(status=400, text=error)
+        self._coordinator.async_apply_push(payload)
+        return None
@@ -0,0 +1,72 @@
+from __future__ import annotations
+from typing import Any, Dict, Iterable, List
+from .const import IDLE_MAX_INTERVAL, BOOST_SECONDS
+
+# Per-room poll cadence: fast while playing/commanded, exponential back-off while idle.
+class RoomScheduler:
+    def __init__(self, fast_interval: float, idle_max_interval: float = IDLE_MAX_INTERVAL) -> None:
+        self._fast = max(1.0, float(fast_interval))
+        self._idle_max = max(self._fast, float(idle_max_interval))
+        self._interval: Dict[str, float] = {}
+        self._next_due: Dict[str, float] = {}
+        self._boost_until: Dict[str, float] = {}
+        self._floor = 0.0
+
+    @property
+    def fast_interval(self) -> float:
+        return self._fast
+
+    @property
+    def floor(self) -> float:
+        return self._floor
+
+    def set_floor(self, floor: float) -> None:
+        # lower bound for non-boosted rooms, e.g. while push updates keep state current
+        self._floor = max(0.0, float(floor))
+
+    def sync_rooms(self, rids: Iterable[str]) -> None:
+        keep = set(rids)
+        for rid in keep:
+            if rid not in self._interval:
+                self._interval[rid] = self._fast
+                self._next_due[rid] = 0.0
+        for rid in list(self._interval):
+            if rid not in keep:
+                self._interval.pop(rid, None)
+                self._next_due.pop(rid, None)
+                self._boost_until.pop(rid, None)
+
+    def due(self, now: float) -> List[str]:
+        # half a tick of slack so coordinator jitter doesn't push a room to the next tick
+        horizon = now + self._fast / 2
+        return [rid for rid, t in self._next_due.items() if t <= horizon]
+
+    def record(self, rid: str, active: bool, now: float) -> None:
+        if rid not in self._interval:
+            return
+        if self._boost_until.get(rid, 0.0) > now:
+            interval = self._fast
+        elif active:
+            interval = max(self._fast, self._floor)
+        else:
+            interval = max(min(self._idle_max, self._interval[rid] * 2), self._floor)
+        self._interval[rid] = interval
+        self._next_due[rid] = now + interval
+
+    def boost(self, rid: str, now: float) -> None:
+        if rid not in self._interval:
+            return
+        self._boost_until[rid] = now + BOOST_SECONDS
+        self._interval[rid] = self._fast
+        self._next_due[rid] = now
+
+    def diagnostics(self, now: float) -> Dict[str, Any]:
+        return {
+            rid: {
+                "interval": iv,
+                "rate_hz": round(1.0 / iv, 3),
+                "next_due_in": round(max(0.0, self._next_due.get(rid, now) - now), 2),
+                "boosted": self._boost_until.get(rid, 0.0) > now,
+            }
+            for rid, iv in self._interval.items()
+        }
@@ -0,0 +1,89 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any, Callable
+from homeassistant.components.sensor import (
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory, UnitOfTime
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from .const import DOMAIN
+from .coordinator import VeoovibesCoordinator
+from .metrics import Metrics
+
+# Diagnostic sensors poll the in-memory metrics on their own slow interval so they never add
+# state writes to the coordinator's hot loop. Disabled by default.
+SCAN_INTERVAL = timedelta(seconds=30)
+
+@dataclass(frozen=True, kw_only=True)
+class VeoovibesSensorDescription(SensorEntityDescription):
+    value_fn: Callable[[Metrics], Any]
+
+SENSORS: tuple[VeoovibesSensorDescription, ...] = (
+    VeoovibesSensorDescription(
+        key="requests_total",
+        name="Requests",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda m: m.total_requests,
+    ),
+    VeoovibesSensorDescription(
+        key="request_errors",
+        name="Request errors",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda m: m.total_errors,
+    ),
+    VeoovibesSensorDescription(
+        key="refresh_duration",
+        name="Refresh duration",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda m: round(m.last_refresh_duration * 1000, 1) if m.last_refresh_duration is not None else None,
+    ),
+    VeoovibesSensorDescription(
+        key="failed_rooms",
+        name="Failed rooms",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda m: m.last_failed_rooms,
+    ),
+    VeoovibesSensorDescription(
+        key="stale_age",
+        name="Data age",
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda m: m.stale_age,
+    ),
+)
+
+async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback) -> None:
+    data = hass.data[DOMAIN][entry.entry_id]
+    coord: VeoovibesCoordinator = data["coordinator"]
+    async_add_entities(VeoovibesMetricSensor(coord, description) for description in SENSORS)
+
+class VeoovibesMetricSensor(SensorEntity):
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_should_poll = True
+    entity_description: VeoovibesSensorDescription
+
+    def __init__(self, coordinator: VeoovibesCoordinator, description: VeoovibesSensorDescription) -> None:
+        self.entity_description = description
+        self._coordinator = coordinator
+        host = coordinator.api.host
+        self._attr_unique_id = f"veoovibes_{host}_{description.key}"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, host)},
+            manufacturer="inveoo GmbH",
+            model="veoovibes controller",
+            name=f"veoovibes ({host})",
+            configuration_url=f"http://{host}",
+        )
+        self._attr_native_value = description.value_fn(coordinator.metrics)
+
+    async def async_update(self) -> None:
+        self._attr_native_value = self.entity_description.value_fn(self._coordinator.metrics)
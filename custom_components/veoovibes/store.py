@@ -0,0 +1,52 @@
+from __future__ import annotations
+import logging
+from typing import Any, Callable, Dict
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from .const import DOMAIN, SNAPSHOT_SAVE_DELAY
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+
+# Last good controller snapshot (room list, favorites, last parsed room states) per config entry.
+# Entities are created from it at boot while the controller is revalidated in the background.
+class SnapshotStore:
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        self._store: Store[Dict[str, Any]] = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.snapshot")
+        self._pending = False
+        self._data_fn: Callable[[], Dict[str, Any]] | None = None
+
+    async def async_load(self) -> Dict[str, Any] | None:
+        try:
+            data = await self._store.async_load()
+        except Exception as e:  # a corrupt snapshot only costs us the fast start
+            _LOGGER.debug("veoovibes: ignoring unreadable snapshot: %s", e)
+            return None
+        if not isinstance(data, dict) or not isinstance(data.get("rooms"), dict) or not data["rooms"]:
+            return None
+        return data
+
+    @callback
+    def async_schedule_save(self, data_fn: Callable[[], Dict[str, Any]]) -> None:
+        # Store.async_delay_save restarts its timer on every call; with a change on most ticks the
+        # write would be postponed indefinitely, so only arm it once per save
+        if self._pending:
+            return
+        self._pending = True
+        self._data_fn = data_fn
+
+        def _data() -> Dict[str, Any]:
+            self._pending = False
+            return data_fn()
+
+        self._store.async_delay_save(_data, SNAPSHOT_SAVE_DELAY)
+
+    async def async_flush(self) -> None:
+        # on unload: write a pending save now instead of leaving its timer armed past the entry
+        if self._pending and self._data_fn is not None:
+            self._pending = False
+            await self._store.async_save(self._data_fn())
+
+    async def async_remove(self) -> None:
+        await self._store.async_remove()
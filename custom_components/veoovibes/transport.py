@@ -0,0 +1,296 @@
+from __future__ import annotations
+import asyncio, contextlib, logging, random, time
+from typing import Any, Callable, Dict, Sequence, Tuple
+from yarl import URL
+import aiohttp
+from .const import (
+    CONNECTION_LIMIT,
+    KEEPALIVE_SECONDS,
+    CONNECT_TIMEOUT,
+    READ_TIMEOUT,
+    REQUEST_RETRIES,
+    RETRY_BACKOFF,
+    BREAKER_THRESHOLD,
+    BREAKER_COOLDOWN,
+    BREAKER_MAX_COOLDOWN,
+    DEFAULT_MAX_PARALLEL,
+)
+from .metrics import Metrics
+
+_LOGGER = logging.getLogger(__name__)
+
+class VeoovibesError(Exception):
+    pass
+
+class VeoovibesConnectionError(VeoovibesError):
+    pass
+
+class VeoovibesTimeoutError(VeoovibesConnectionError):
+    pass
+
+class VeoovibesUnavailableError(VeoovibesConnectionError):
+    pass
+
+class VeoovibesApiError(VeoovibesError):
+    pass
+
+def create_session(limit_per_host: int = CONNECTION_LIMIT, limit: int = 100) -> aiohttp.ClientSession:
+    connector = aiohttp.TCPConnector(limit=limit, limit_per_host=limit_per_host, keepalive_timeout=KEEPALIVE_SECONDS)
+    return aiohttp.ClientSession(connector=connector)
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        threshold: int = BREAKER_THRESHOLD,
+        cooldown: float = BREAKER_COOLDOWN,
+        max_cooldown: float = BREAKER_MAX_COOLDOWN,
+    ) -> None:
+        self._threshold = threshold
+        self._base_cooldown = cooldown
+        self._max_cooldown = max_cooldown
+        self._cooldown = cooldown
+        self._failures = 0
+        self._open_until: float | None = None
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        if self._open_until is None:
+            return "closed"
+        return "half_open" if time.monotonic() >= self._open_until else "open"
+
+    def allow(self) -> bool:
+        if self._open_until is None:
+            return True
+        if time.monotonic() < self._open_until or self._probing:
+            return False
+        # half-open: let exactly one probe through
+        self._probing = True
+        return True
+
+    @property
+    def probing(self) -> bool:
+        return self._probing
+
+    def end_probe(self) -> None:
+        # a probe that ended without an outcome (cancelled, unexpected error) frees the slot again
+        self._probing = False
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._open_until = None
+        self._probing = False
+        self._cooldown = self._base_cooldown
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._probing:
+            self._probing = False
+            self._cooldown = min(self._max_cooldown, self._cooldown * 2)
+            self._open_until = time.monotonic() + self._cooldown
+        elif self._failures >= self._threshold:
+            self._open_until = time.monotonic() + self._cooldown
+
+    def diagnostics(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self._failures,
+            "cooldown": self._cooldown,
+            "open_for": round(max(0.0, self._open_until - time.monotonic()), 1) if self._open_until else 0.0,
+        }
+
+class VeoovibesTransport:
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        host: str,
+        retries: int = REQUEST_RETRIES,
+        max_parallel: int = DEFAULT_MAX_PARALLEL,
+        budget: Any = None,
+    ) -> None:
+        self._session = session
+        self._budget = budget
+        self._host = host
+        self._retries = retries
+        # host may carry a port ("10.0.0.5:8080"), so parse instead of URL.build(host=...)
+        self._origin = URL(f"http://{host}")
+        self._base = self._origin / "api" / "v1"
+        self._timeout = aiohttp.ClientTimeout(total=CONNECT_TIMEOUT + READ_TIMEOUT, connect=CONNECT_TIMEOUT, sock_read=READ_TIMEOUT)
+        self.breaker = CircuitBreaker()
+        self.metrics = Metrics()
+        self._max_parallel = max(1, max_parallel)
+        self._semaphore = asyncio.Semaphore(self._max_parallel)
+        self._inflight: Dict[Tuple[str, Tuple[Tuple[str, str], ...], bool], asyncio.Future] = {}
+        self.coalesced = 0
+
+    def diagnostics(self) -> Dict[str, Any]:
+        return {
+            "max_parallel": self._max_parallel,
+            "in_flight": len(self._inflight),
+            "coalesced": self.coalesced,
+            "breaker": self.breaker.diagnostics(),
+        }
+
+    @property
+    def available(self) -> bool:
+        return self.breaker.state != "open"
+
+    @property
+    def max_parallel(self) -> int:
+        return self._max_parallel
+
+    def url(self, path: str) -> URL:
+        return self._base / path
+
+    def resolve(self, url: str) -> URL:
+        target = URL(url)
+        if not target.is_absolute():
+            target = self._origin.join(target)
+        return target
+
+    async def _request(
+        self,
+        url: URL,
+        params: Sequence[Tuple[str, str]] | None,
+        idempotent: bool,
+        read: str,
+        headers: Dict[str, str] | None = None,
+        isolated: bool = False,
+        on_start: Callable[[], None] | None = None,
+        limited: bool = True,
+    ) -> Any:
+        # limited=False: not the controller's API (cover art), so no request budget or parallel slot
+        # isolated: a per-room read; one attempt, and its outcome says nothing about the host, so it
+        # neither feeds nor probes the breaker (it is still refused while the breaker is open)
+        attempts = 1 if isolated else 1 + (self._retries if idempotent else 0)
+        endpoint = "cover" if read == "bytes" else url.name
+        # the breaker is consulted and updated once per logical request, not per attempt
+        if isolated:
+            if not self.available:
+                raise VeoovibesUnavailableError(f"{self._host} unavailable, backing off")
+        elif not self.breaker.allow():
+            raise VeoovibesUnavailableError(f"{self._host} unavailable, backing off")
+        probe = not isolated and self.breaker.probing
+        try:
+            for attempt in range(attempts):
+                if limited and self._budget is not None:
+                    await self._budget.acquire()
+                try:
+                    async with self._semaphore if limited else contextlib.nullcontext():
+                        # on_start: the caller's clock starts once the read holds a slot, not while it queues
+                        started = time.monotonic()
+                        if on_start is not None:
+                            on_start()
+                        async with self._session.get(url, params=params, headers=headers, timeout=self._timeout) as resp:
+                            if resp.status == 304:
+                                body = (None, resp.headers.get("ETag"))
+                            elif resp.status >= 500:
+                                raise VeoovibesConnectionError(f"{url.path}: HTTP {resp.status}")
+                            elif resp.status >= 400:
+                                raise VeoovibesApiError(f"{url.path}: HTTP {resp.status}")
+                            elif read == "bytes":
+                                body = (await resp.read(), resp.headers.get("Content-Type"))
+                            else:
+                                try:
+                                    body = await resp.json(content_type=None)
+                                except ValueError as e:
+                                    raise VeoovibesApiError(f"{url.path}: invalid response: {e}") from e
+                                if read == "json_etag":
+                                    body = (body, resp.headers.get("ETag"))
+                except VeoovibesApiError:
+                    # the controller answered, so the host itself is healthy
+                    self.metrics.record_request(endpoint, time.monotonic() - started, "api")
+                    if not isolated:
+                        self.breaker.record_success()
+                    raise
+                except asyncio.TimeoutError:
+                    err: VeoovibesConnectionError = VeoovibesTimeoutError(f"{url.path}: timeout")
+                except VeoovibesConnectionError as e:
+                    err = e
+                except aiohttp.ClientError as e:
+                    err = VeoovibesConnectionError(f"{url.path}: {e}")
+                else:
+                    self.metrics.record_request(endpoint, time.monotonic() - started)
+                    if not isolated:
+                        self.breaker.record_success()
+                    return body
+
+                self.metrics.record_request(endpoint, time.monotonic() - started, "timeout" if isinstance(err, VeoovibesTimeoutError) else "error")
+                if attempt + 1 >= attempts:
+                    if not isolated:
+                        self.breaker.record_failure()
+                    raise err
+                delay = RETRY_BACKOFF * (2 ** attempt) * random.uniform(0.5, 1.5)
+                _LOGGER.debug("%s failed (%s), retry %s in %.2fs", url.path, err, attempt + 1, delay)
+                await asyncio.sleep(delay)
+            raise VeoovibesConnectionError(f"{url.path}: no attempts made")
+        finally:
+            if probe:
+                self.breaker.end_probe()
+
+    async def _shared(
+        self,
+        url: URL,
+        params: Sequence[Tuple[str, str]] | None,
+        read: str,
+        isolated: bool = False,
+        on_start: Callable[[], None] | None = None,
+        limited: bool = True,
+    ) -> Any:
+        # identical concurrent reads share one request
+        key = (str(url), tuple(params or ()), isolated)
+        fut = self._inflight.get(key)
+        if fut is not None:
+            self.coalesced += 1
+            if on_start is not None:
+                on_start()
+            return await asyncio.shield(fut)
+        fut = asyncio.get_running_loop().create_future()
+        self._inflight[key] = fut
+        try:
+            result = await self._request(url, params, True, read, isolated=isolated, on_start=on_start, limited=limited)
+        except VeoovibesError as e:
+            fut.set_exception(e)
+            raise
+        except BaseException:
+            fut.set_exception(VeoovibesConnectionError(f"{url.path}: request cancelled"))
+            raise
+        else:
+            fut.set_result(result)
+            return result
+        finally:
+            self._inflight.pop(key, None)
+            if fut.done() and not fut.cancelled():
+                fut.exception()  # mark retrieved when nobody else was waiting
+
+    async def get_json(
+        self,
+        path: str,
+        params: Sequence[Tuple[str, str]],
+        idempotent: bool = True,
+        isolated: bool = False,
+        on_start: Callable[[], None] | None = None,
+    ) -> Dict[str, Any]:
+        if idempotent:
+            data = await self._shared(self.url(path), params, "json", isolated, on_start)
+        else:
+            data = await self._request(self.url(path), params, False, "json")
+        if not isinstance(data, dict) or data.get("status") != "succeeded":
+            raise VeoovibesApiError(f"API failed {path}: {data}")
+        return data
+
+    async def get_json_conditional(
+        self, path: str, params: Sequence[Tuple[str, str]], etag: str | None
+    ) -> Tuple[Dict[str, Any] | None, str | None]:
+        # returns (None, etag) when the controller answers 304 Not Modified
+        headers = {"If-None-Match": etag} if etag else None
+        data, new_etag = await self._request(self.url(path), params, True, "json_etag", headers)
+        if data is None:
+            return None, new_etag or etag
+        if not isinstance(data, dict) or data.get("status") != "succeeded":
+            raise VeoovibesApiError(f"API failed {path}: {data}")
+        return data, new_etag
+
+    async def get_bytes(self, url: str) -> Tuple[bytes, str | None]:
+        # cover art often lives on a CDN: an unreachable image host must not open the controller's breaker
+        return await self._shared(self.resolve(url), None, "bytes", isolated=True, limited=False)
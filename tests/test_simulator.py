@@ -0,0 +1,231 @@
+"""Smoke tests: drive the coordinator against the local controller simulator."""
+from __future__ import annotations
+import asyncio, os, sys, tempfile, time
+import pytest
+
+pytest.importorskip("aiohttp")
+pytest.importorskip("homeassistant")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "tools"))
+
+from homeassistant.components.media_player.const import MediaPlayerState  # noqa: E402
+from homeassistant.core import HomeAssistant  # noqa: E402
+from custom_components.veoovibes.api import VeoovibesApi  # noqa: E402
+from custom_components.veoovibes.const import DEFAULT_MAX_PARALLEL, ROOM_REMOVE_AFTER, ROOM_STATUS_DEADLINE  # noqa: E402
+from custom_components.veoovibes.coordinator import VeoovibesCoordinator  # noqa: E402
+from custom_components.veoovibes.discovery import async_probe  # noqa: E402
+from custom_components.veoovibes.store import SnapshotStore  # noqa: E402
+from custom_components.veoovibes.transport import create_session  # noqa: E402
+from veoovibes_sim import SimConfig, VeoovibesSimulator, start  # noqa: E402
+
+ROOMS = 8
+
+def _run(scenario, batch_status: bool = True, max_parallel: int = DEFAULT_MAX_PARALLEL, **sim_config) -> None:
+    async def _main() -> None:
+        with tempfile.TemporaryDirectory() as config_dir:
+            hass = HomeAssistant(config_dir)
+            config = SimConfig(**{"rooms": ROOMS, "track_change_rate": 0.0, **sim_config})
+            sim = VeoovibesSimulator(config, seed=1)
+            runner, port = await start(sim)
+            session = create_session()
+            api = VeoovibesApi(session, f"127.0.0.1:{port}", "sim", max_parallel=max_parallel)
+            coord = VeoovibesCoordinator(hass, api, 1, batch_status=batch_status, scheduled=False)
+            try:
+                await scenario(sim, coord)
+            finally:
+                await coord.async_shutdown()
+                await session.close()
+                await runner.cleanup()
+                await hass.async_stop(force=True)
+
+    asyncio.run(_main())
+
+def test_first_refresh_matches_simulator() -> None:
+    async def scenario(sim: VeoovibesSimulator, coord: VeoovibesCoordinator) -> None:
+        await coord.async_refresh()
+        assert coord.last_update_success
+        rooms = coord.data["rooms"]
+        assert set(rooms) == set(sim.rooms)
+        for rid, sim_room in sim.rooms.items():
+            room = rooms[rid]
+            assert room.name == sim_room.name
+            assert room.is_playing == sim_room.playing
+            assert room.volume == pytest.approx(sim_room.volume / 100.0)
+
+    _run(scenario)
+
+def test_sweep_request_budget_and_sharing() -> None:
+    async def scenario(sim: VeoovibesSimulator, coord: VeoovibesCoordinator) -> None:
+        await coord.async_refresh()
+        first = dict(coord.data["rooms"])
+        before = sim.stats["_total"]
+        for rid in first:
+            coord.scheduler.boost(rid, 0.0)
+        await coord.async_refresh()
+        # one feedback call for all rooms, no room list reload, status only where feedback moved
+        assert sim.stats["_total"] - before <= 1 + ROOMS
+        assert sim.stats["listrooms"] == 1
+        # idle rooms did not change, so they keep the very same state object
+        for rid, room in first.items():
+            if not sim.rooms[rid].playing:
+                assert coord.data["rooms"][rid] is room
+
+    _run(scenario)
+
+def test_batch_feedback_sees_backed_off_rooms_start() -> None:
+    async def scenario(sim: VeoovibesSimulator, coord: VeoovibesCoordinator) -> None:
+        await coord.async_refresh()
+        rid = next(r for r, room in sim.rooms.items() if not room.playing)
+        for _ in range(6):
+            coord.scheduler.record(rid, False, time.monotonic())
+        assert rid not in coord.scheduler.due(time.monotonic())
+        sim.rooms[rid].playing = True
+        await coord.async_refresh()
+        assert coord.data["rooms"][rid].is_playing
+        assert coord.scheduler.diagnostics(time.monotonic())[rid]["interval"] == coord.scheduler.fast_interval
+
+    _run(scenario)
+
+def test_status_reads_without_changes_wake_nobody() -> None:
+    async def scenario(sim: VeoovibesSimulator, coord: VeoovibesCoordinator) -> None:
+        await coord.async_refresh()
+        woken: list[str] = []
+        for rid in coord.data["rooms"]:
+            coord.async_add_listener(lambda rid=rid: woken.append(rid), rid)
+        for rid in sim.rooms:
+            coord.scheduler.boost(rid, 0.0)
+        # every room's status is read again; playing positions only advanced as interpolated
+        await coord.async_refresh()
+        assert woken == []
+
+    _run(scenario, batch_status=False)
+
+def test_hanging_rooms_do_not_hold_up_the_sweep() -> None:
+    async def scenario(sim: VeoovibesSimulator, coord: VeoovibesCoordinator) -> None:
+        await coord.async_refresh()
+        hung = ["1", "2"]
+        for rid in hung:
+            sim.rooms[rid].hang_status = True
+        for rid in sim.rooms:
+            coord.scheduler.boost(rid, 0.0)
+        started = time.monotonic()
+        await coord.async_refresh()
+        assert time.monotonic() - started < 3.0
+        assert coord.last_update_success
+        assert coord.api.transport.breaker.state == "closed"
+        # the slow reads carry on in the background; nothing failed yet, so nothing is stale
+        for rid in hung:
+            assert coord.health.probing(rid)
+        assert not any(room.stale for room in coord.data["rooms"].values())
+        assert coord.metrics.last_failed_rooms == 0
+
+    _run(scenario, batch_status=False, hang_seconds=5.0)
+
+def test_queued_status_reads_are_not_late() -> None:
+    rooms, latency, max_parallel = 24, 0.3, 4
+    assert rooms / max_parallel * latency > ROOM_STATUS_DEADLINE
+
+    async def scenario(sim: VeoovibesSimulator, coord: VeoovibesCoordinator) -> None:
+        await coord.async_refresh()
+        for _ in range(2):
+            for rid in sim.rooms:
+                coord.scheduler.boost(rid, 0.0)
+            await coord.async_refresh()
+            assert not any(room.stale for room in coord.data["rooms"].values())
+            assert not any(coord.health.probing(rid) for rid in sim.rooms)
+            assert coord.health.diagnostics(time.monotonic()) == {}
+
+    _run(scenario, batch_status=False, max_parallel=max_parallel, rooms=rooms, latency=latency)
+
+def test_rooms_are_removed_only_after_repeated_misses() -> None:
+    async def scenario(sim: VeoovibesSimulator, coord: VeoovibesCoordinator) -> None:
+        await coord.async_refresh()
+        rooms = dict(sim.rooms)
+        # a controller answering with no rooms at all is not believed
+        sim.rooms.clear()
+        coord._rooms_next = 0.0
+        await coord.async_refresh()
+        assert coord.last_update_success
+        assert set(coord.data["rooms"]) == set(rooms)
+        sim.rooms.update(rooms)
+        sim.rooms.pop("1")
+        for _ in range(ROOM_REMOVE_AFTER - 1):
+            coord._rooms_next = 0.0
+            await coord.async_refresh()
+            assert "1" in coord.data["rooms"]
+        coord._rooms_next = 0.0
+        await coord.async_refresh()
+        assert "1" not in coord.data["rooms"]
+
+    _run(scenario)
+
+def test_unreachable_cover_host_leaves_controller_alone() -> None:
+    async def scenario(sim: VeoovibesSimulator, coord: VeoovibesCoordinator) -> None:
+        await coord.async_refresh()
+        rid = next(r for r, room in sim.rooms.items() if room.playing)
+        image, content_type = await coord.async_get_cover(rid)
+        assert image and sim.stats["cover"] == 1
+        room = coord.data["rooms"][rid]
+        coord.data["rooms"][rid] = room.replace(cover="http://127.0.0.1:9/cover.jpg", cover_token="dead")
+        for _ in range(5):
+            assert await coord.async_get_cover(rid) == (None, None)
+        assert coord.api.transport.breaker.state == "closed"
+        # the failure is cached for this cover token, so the dead host was only tried once
+        assert coord.metrics.endpoints["cover"].requests == 2
+
+    _run(scenario)
+
+def test_volume_push_keeps_the_playing_text() -> None:
+    async def scenario(sim: VeoovibesSimulator, coord: VeoovibesCoordinator) -> None:
+        await coord.async_refresh()
+        rid = next(r for r, room in sim.rooms.items() if room.playing)
+        title = coord.data["rooms"][rid].title
+        coord.async_apply_push({"roomvolume": [{"roomid": rid, "roomvol": "77"}]})
+        room = coord.data["rooms"][rid]
+        assert room.volume == pytest.approx(0.77)
+        assert room.is_playing and room.title == title
+        assert coord._fb_text[rid]["roomtitle"] == title
+        # a room listed without text has stopped; its volume is untouched
+        coord.async_apply_push({"rooms": [rid], "playertext": []})
+        assert rid not in coord._fb_text
+        assert coord.data["rooms"][rid].volume == pytest.approx(0.77)
+
+    _run(scenario)
+
+def test_shutdown_flushes_the_pending_snapshot() -> None:
+    async def scenario(sim: VeoovibesSimulator, coord: VeoovibesCoordinator) -> None:
+        coord.snapshot_store = SnapshotStore(coord.hass, "sim")
+        await coord.async_refresh()
+        coord.async_schedule_save()
+        await coord.async_shutdown()
+        snapshot = await SnapshotStore(coord.hass, "sim").async_load()
+        assert snapshot is not None and set(snapshot["rooms"]) == set(sim.rooms)
+
+    _run(scenario)
+
+def test_probe_tells_wrong_key_from_wrong_host() -> None:
+    async def scenario(sim: VeoovibesSimulator, coord: VeoovibesCoordinator) -> None:
+        host = coord.api.host
+        probe = await async_probe(coord.hass, host, "sim", use_cache=False)
+        assert probe is not None and probe["authorized"] and probe["rooms"] == ROOMS
+        probe = await async_probe(coord.hass, host, "wrong", use_cache=False)
+        assert probe is not None and not probe["authorized"]
+        started = time.monotonic()
+        assert await async_probe(coord.hass, "10.255.255.1", "sim", use_cache=False) is None
+        assert await async_probe(coord.hass, "127.0.0.1:notaport", "sim", use_cache=False) is None
+        assert time.monotonic() - started < 3.0
+
+    _run(scenario)
+
+def test_command_reaches_simulator() -> None:
+    async def scenario(sim: VeoovibesSimulator, coord: VeoovibesCoordinator) -> None:
+        await coord.async_refresh()
+        rid = next(r for r, room in sim.rooms.items() if not room.playing)
+        await coord.commands.async_send("room_play", [rid])
+        assert sim.rooms[rid].playing
+        await coord.async_refresh_rooms([rid])
+        assert coord.data["rooms"][rid].state == MediaPlayerState.PLAYING
+
+    _run(scenario)
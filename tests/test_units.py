@@ -0,0 +1,166 @@
+"""Unit tests for the pure pieces: no Home Assistant instance, no simulator."""
+from __future__ import annotations
+import asyncio, os, sys
+import pytest
+
+pytest.importorskip("aiohttp")
+pytest.importorskip("homeassistant")  # importing the package runs its __init__
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from custom_components.veoovibes.const import BOOST_SECONDS, FAV_PAGE_SIZE, ROOM_FAILURE_THRESHOLD, SCAN_MAX_HOSTS  # noqa: E402
+from custom_components.veoovibes.discovery import scan_hosts  # noqa: E402
+from custom_components.veoovibes.favorites import FAVORITES_ID, PAGE_PREFIX, FavoritesStore  # noqa: E402
+from custom_components.veoovibes.health import RoomHealth  # noqa: E402
+from custom_components.veoovibes.push import _payload_error  # noqa: E402
+from custom_components.veoovibes.scheduler import RoomScheduler  # noqa: E402
+from custom_components.veoovibes.transport import (  # noqa: E402
+    CircuitBreaker,
+    VeoovibesConnectionError,
+    VeoovibesTransport,
+    create_session,
+)
+
+# ---------- CircuitBreaker ----------
+def test_breaker_opens_after_threshold_and_probes_once() -> None:
+    breaker = CircuitBreaker(threshold=2, cooldown=0.0)
+    breaker.record_failure()
+    assert breaker.state == "closed"
+    breaker.record_failure()
+    assert breaker.state == "half_open"
+    assert breaker.allow() and breaker.probing
+    assert not breaker.allow()
+    breaker.record_success()
+    assert breaker.state == "closed" and not breaker.probing
+
+def test_retried_request_counts_one_breaker_failure() -> None:
+    async def main() -> None:
+        session = create_session()
+        try:
+            # nothing listens on the discard port: every attempt is refused right away
+            transport = VeoovibesTransport(session, "127.0.0.1:9", retries=2)
+            with pytest.raises(VeoovibesConnectionError):
+                await transport.get_json("listrooms", [])
+            assert transport.breaker.diagnostics()["consecutive_failures"] == 1
+            assert transport.metrics.endpoints["listrooms"].requests == 3
+        finally:
+            await session.close()
+
+    asyncio.run(main())
+
+def test_cancelled_probe_releases_the_half_open_slot() -> None:
+    async def main() -> None:
+        # accepts connections but never answers
+        server = await asyncio.start_server(lambda r, w: None, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        session = create_session()
+        try:
+            transport = VeoovibesTransport(session, f"127.0.0.1:{port}")
+            transport.breaker = CircuitBreaker(threshold=1, cooldown=0.0)
+            transport.breaker.record_failure()
+            task = asyncio.ensure_future(transport.get_json("listrooms", []))
+            await asyncio.sleep(0.2)
+            assert transport.breaker.probing
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            assert not transport.breaker.probing
+            assert transport.breaker.allow()
+        finally:
+            await session.close()
+            server.close()
+            await server.wait_closed()
+
+    asyncio.run(main())
+
+# ---------- RoomScheduler ----------
+def test_scheduler_backs_off_idle_rooms() -> None:
+    scheduler = RoomScheduler(2, idle_max_interval=10)
+    scheduler.sync_rooms(["1"])
+    assert scheduler.due(0.0) == ["1"]
+    intervals = []
+    for _ in range(4):
+        scheduler.record("1", False, 0.0)
+        intervals.append(scheduler.diagnostics(0.0)["1"]["interval"])
+    assert intervals == [4, 8, 10, 10]
+    scheduler.record("1", True, 0.0)
+    assert scheduler.diagnostics(0.0)["1"]["interval"] == 2
+
+def test_scheduler_floor_and_boost() -> None:
+    scheduler = RoomScheduler(2)
+    scheduler.sync_rooms(["1"])
+    scheduler.set_floor(30)
+    scheduler.record("1", True, 0.0)
+    assert scheduler.diagnostics(0.0)["1"]["interval"] == 30
+    # a commanded room ignores the floor while boosted
+    scheduler.boost("1", 0.0)
+    assert scheduler.due(0.0) == ["1"]
+    scheduler.record("1", False, 1.0)
+    assert scheduler.diagnostics(1.0)["1"]["interval"] == 2
+    scheduler.record("1", False, BOOST_SECONDS + 1.0)
+    assert scheduler.diagnostics(BOOST_SECONDS + 1.0)["1"]["interval"] == 30
+
+# ---------- RoomHealth ----------
+def test_health_threshold_and_recovery() -> None:
+    health = RoomHealth(1)
+    assert health.flags("1") == (False, True)
+    for _ in range(ROOM_FAILURE_THRESHOLD - 1):
+        health.record_failure("1", 0.0)
+    assert health.flags("1") == (True, True)
+    health.record_failure("1", 0.0)
+    assert health.flags("1") == (True, False)
+    assert health.probes_due(0.0) == []
+    assert health.probes_due(1000.0) == ["1"]
+    # already probing: not handed out twice
+    assert health.probes_due(1000.0) == []
+    assert health.record_success("1")
+    assert health.flags("1") == (False, True) and health.healthy("1")
+
+# ---------- Push payloads ----------
+@pytest.mark.parametrize(
+    "payload, ok",
+    [
+        ({"playertext": [{"roomid": "1", "roomtext": "x"}], "roomvolume": [{"roomid": 1, "roomvol": "20"}]}, True),
+        ({"result": {"rooms": ["1", 2], "room_status": {"1": {}}}}, True),
+        ({}, True),
+        ([], False),
+        ({"playertext": {"roomid": "1"}}, False),
+        ({"roomvolume": [{"roomvol": "20"}]}, False),
+        ({"rooms": "1"}, False),
+        ({"rooms": [None]}, False),
+        ({"room_status": []}, False),
+    ],
+)
+def test_payload_error(payload, ok: bool) -> None:
+    assert (_payload_error(payload) is None) is ok
+
+# ---------- Discovery ----------
+def test_scan_hosts_limits() -> None:
+    assert scan_hosts("192.168.1.0/30") == ["192.168.1.1", "192.168.1.2"]
+    assert scan_hosts(" 10.0.0.7 ") == ["10.0.0.7"]
+    assert len(scan_hosts("10.0.0.0/22")) == SCAN_MAX_HOSTS - 2
+    for subnet in ("10.0.0.0/21", "not a subnet", ""):
+        with pytest.raises(ValueError):
+            scan_hosts(subnet)
+
+# ---------- Favorites ----------
+def _favorites(count: int) -> FavoritesStore:
+    store = FavoritesStore(None, None)  # browsing needs neither hass nor the controller
+    store.restore({f"f{i}": {"favId": f"f{i}", "name": f"Station {i:04d}"} for i in range(count)})
+    return store
+
+def test_favorites_fit_on_one_page() -> None:
+    node = _favorites(FAV_PAGE_SIZE).browse()
+    assert len(node.children) == FAV_PAGE_SIZE
+    assert not any(child.can_expand for child in node.children)
+
+def test_favorites_browse_paging() -> None:
+    store = _favorites(FAV_PAGE_SIZE * 2 + 5)
+    root = store.browse(FAVORITES_ID)
+    assert [child.media_content_id for child in root.children] == [f"{PAGE_PREFIX}{p}" for p in range(3)]
+    assert root.children[0].title == f"Station 0000 – Station {FAV_PAGE_SIZE - 1:04d}"
+    last = store.browse(f"{PAGE_PREFIX}2")
+    assert [child.media_content_id for child in last.children] == [f"f{i}" for i in range(FAV_PAGE_SIZE * 2, FAV_PAGE_SIZE * 2 + 5)]
+    # out-of-range pages clamp; nodes are cached per catalog version
+    assert store.browse(f"{PAGE_PREFIX}9").children[0].media_content_id == f"f{FAV_PAGE_SIZE * 2}"
+    assert store.browse(f"{PAGE_PREFIX}2") is last
@@ -0,0 +1,140 @@
+"""Load/latency benchmark for VeoovibesCoordinator against the local simulator.
+
+    python tools/bench.py --rooms 1,8,24,50,200 --cycles 20 --latency 0.01 --jitter 0.005
+
+For each room count a fresh simulator and coordinator are started and the coordinator is
+refreshed once per --interval. The simulator runs in its own process, so CPU time per tick
+and refresh latency only cover the coordinator side. Reported per room count: requests per
+cycle, refresh latency percentiles, CPU time per tick and entity state writes (room
+listeners woken) per cycle. Requires Home Assistant and aiohttp to be installed.
+"""
+from __future__ import annotations
+import argparse, asyncio, json, os, re, statistics, sys, tempfile, time
+from typing import Any, Dict, List
+import aiohttp
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from homeassistant.core import HomeAssistant  # noqa: E402
+from custom_components.veoovibes.api import VeoovibesApi  # noqa: E402
+from custom_components.veoovibes.coordinator import VeoovibesCoordinator  # noqa: E402
+from custom_components.veoovibes.transport import create_session  # noqa: E402
+
+SIM = os.path.join(os.path.dirname(os.path.abspath(__file__)), "veoovibes_sim.py")
+
+def _pct(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))]
+
+async def _start_sim(rooms: int, args: argparse.Namespace) -> tuple[asyncio.subprocess.Process, int]:
+    proc = await asyncio.create_subprocess_exec(
+        sys.executable, SIM,
+        "--port", "0",
+        "--rooms", str(rooms),
+        "--latency", str(args.latency),
+        "--jitter", str(args.jitter),
+        "--failure-rate", str(args.failure_rate),
+        "--timeout-rate", str(args.timeout_rate),
+        "--hang-seconds", "10",
+        "--seed", str(args.seed),
+        stdout=asyncio.subprocess.PIPE,
+    )
+    line = (await asyncio.wait_for(proc.stdout.readline(), 30)).decode()
+    match = re.search(r":(\d+) ", line)
+    if match is None:
+        proc.kill()
+        raise RuntimeError(f"simulator did not start: {line!r}")
+    return proc, int(match.group(1))
+
+async def _sim_total(stats_session: aiohttp.ClientSession, port: int) -> Dict[str, int]:
+    async with stats_session.get(f"http://127.0.0.1:{port}/sim/stats") as resp:
+        return await resp.json()
+
+async def bench_rooms(hass: HomeAssistant, rooms: int, args: argparse.Namespace) -> Dict[str, Any]:
+    proc, port = await _start_sim(rooms, args)
+    session = create_session(args.max_parallel)
+    stats_session = aiohttp.ClientSession()
+    try:
+        api = VeoovibesApi(session, f"127.0.0.1:{port}", "sim", max_parallel=args.max_parallel)
+        # the benchmark drives refreshes itself, like the hub does
+        coord = VeoovibesCoordinator(hass, api, args.interval, batch_status=not args.no_batch, scheduled=False)
+
+        writes = {"n": 0}
+        def _listener() -> None:
+            writes["n"] += 1
+
+        await coord.async_refresh()
+        for rid in (coord.data or {}).get("rooms", {}):
+            coord.async_add_listener(_listener, str(rid))
+
+        latencies: List[float] = []
+        cpu: List[float] = []
+        requests: List[int] = []
+        state_writes: List[int] = []
+        stats = await _sim_total(stats_session, port)
+        for _ in range(args.cycles):
+            started = time.monotonic()
+            before_req, before_writes = stats.get("_total", 0), writes["n"]
+            t0, c0 = time.perf_counter(), time.process_time()
+            await coord.async_refresh()
+            latencies.append((time.perf_counter() - t0) * 1000)
+            cpu.append((time.process_time() - c0) * 1000)
+            stats = await _sim_total(stats_session, port)
+            requests.append(stats.get("_total", 0) - before_req)
+            state_writes.append(writes["n"] - before_writes)
+            await asyncio.sleep(max(0.0, args.interval - (time.monotonic() - started)))
+
+        await coord.async_shutdown()
+        return {
+            "rooms": rooms,
+            "requests_per_cycle": round(statistics.mean(requests), 2),
+            "latency_ms_p50": round(_pct(latencies, 50), 2),
+            "latency_ms_p95": round(_pct(latencies, 95), 2),
+            "latency_ms_p99": round(_pct(latencies, 99), 2),
+            "cpu_ms_per_tick": round(statistics.mean(cpu), 3),
+            "state_writes_per_cycle": round(statistics.mean(state_writes), 2),
+            "suppressed_writes": coord.suppressed_writes,
+            "endpoints": {k: v for k, v in stats.items() if not k.startswith("_")},
+        }
+    finally:
+        await stats_session.close()
+        await session.close()
+        proc.terminate()
+        await proc.wait()
+
+async def _main(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        try:
+            results = [await bench_rooms(hass, int(n), args) for n in args.rooms.split(",")]
+        finally:
+            await hass.async_stop(force=True)
+    return results
+
+def _parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("--rooms", default="1,8,24,50,200", help="comma separated room counts")
+    p.add_argument("--cycles", type=int, default=20)
+    p.add_argument("--interval", type=float, default=1.0)
+    p.add_argument("--latency", type=float, default=0.005)
+    p.add_argument("--jitter", type=float, default=0.0)
+    p.add_argument("--failure-rate", type=float, default=0.0)
+    p.add_argument("--timeout-rate", type=float, default=0.0)
+    p.add_argument("--max-parallel", type=int, default=4)
+    p.add_argument("--no-batch", action="store_true", help="disable batch status mode")
+    p.add_argument("--seed", type=int, default=1)
+    p.add_argument("--json", help="write results to this file")
+    return p
+
+if __name__ == "__main__":
+    args = _parser().parse_args()
+    results = asyncio.run(_main(args))
+    cols = ["rooms", "requests_per_cycle", "latency_ms_p50", "latency_ms_p95", "latency_ms_p99", "cpu_ms_per_tick", "state_writes_per_cycle"]
+    print("  ".join(f"{c:>22}" for c in cols))
+    for r in results:
+        print("  ".join(f"{r[c]:>22}" for c in cols))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as fh:
+            json.dump(results, fh, indent=2)
@@ -0,0 +1,260 @@
+"""Stand-in veoovibes controller for offline load and latency testing.
+
+    python tools/veoovibes_sim.py --rooms 24 --port 8099 --latency 0.02 --jitter 0.01
+
+Serves the /api/v1 endpoints used by the integration with configurable room count,
+response latency, jitter and failure rates. Request counts per endpoint are available
+at /sim/stats (and reset via /sim/reset).
+"""
+from __future__ import annotations
+import argparse, asyncio, hashlib, json, random, time
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Dict, List
+from aiohttp import web
+
+TRACKS = [
+    ("Blue in Green", "Miles Davis", "Kind of Blue"),
+    ("Teardrop", "Massive Attack", "Mezzanine"),
+    ("Hyperballad", "Björk", "Post"),
+    ("Windowlicker", "Aphex Twin", "Windowlicker"),
+    ("Svefn-g-englar", "Sigur Rós", "Ágætis byrjun"),
+    ("Roygbiv", "Boards of Canada", "Music Has the Right to Children"),
+]
+
+@dataclass
+class SimConfig:
+    rooms: int = 8
+    favorites: int = 20
+    api_key: str = "sim"
+    latency: float = 0.0
+    jitter: float = 0.0
+    failure_rate: float = 0.0  # fraction answered with HTTP 500
+    timeout_rate: float = 0.0  # fraction that never answer within the client timeout
+    hang_seconds: float = 30.0
+    playing_ratio: float = 0.25  # rooms playing at start
+    track_change_rate: float = 0.02  # per playing room per second
+
+@dataclass
+class SimRoom:
+    rid: str
+    name: str
+    available: bool = True
+    playing: bool = False
+    track: int = 0
+    volume: int = 30
+    position: float = 0.0
+    duration: float = 240.0
+    hang_status: bool = False  # room_player_status for this room never answers in time
+
+class VeoovibesSimulator:
+    def __init__(self, config: SimConfig, seed: int | None = None) -> None:
+        self.config = config
+        self.random = random.Random(seed)
+        self.stats: Counter[str] = Counter()
+        self.rooms: Dict[str, SimRoom] = {}
+        for i in range(1, config.rooms + 1):
+            room = SimRoom(str(i), f"Room {i}", volume=self.random.randint(10, 60))
+            room.playing = self.random.random() < config.playing_ratio
+            room.track = self.random.randrange(len(TRACKS))
+            self.rooms[room.rid] = room
+        self.favorites = {
+            f"fav{i}": {"favId": f"fav{i}", "name": f"Station {i:03d}", "type": "radio", "image": None}
+            for i in range(config.favorites)
+        }
+        self._fav_etag = self._etag(self.favorites)
+        self._last_tick = time.monotonic()
+
+    @staticmethod
+    def _etag(obj: Any) -> str:
+        return '"' + hashlib.sha1(json.dumps(obj, sort_keys=True).encode()).hexdigest()[:16] + '"'
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get("/api/v1/{endpoint}", self._handle)
+        app.router.add_get("/cover/{rid}/{track}.jpg", self._cover)
+        app.router.add_get("/sim/stats", self._stats)
+        app.router.add_get("/sim/reset", self._reset)
+        return app
+
+    # ---------- Simulation ----------
+    def _advance(self) -> None:
+        now = time.monotonic()
+        dt, self._last_tick = now - self._last_tick, now
+        for room in self.rooms.values():
+            if not room.playing:
+                continue
+            room.position += dt
+            if room.position >= room.duration or self.random.random() < self.config.track_change_rate * dt:
+                self._next(room)
+
+    def _next(self, room: SimRoom, step: int = 1) -> None:
+        room.track = (room.track + step) % len(TRACKS)
+        room.position = 0.0
+        room.duration = float(self.random.randint(150, 420))
+
+    def _status(self, room: SimRoom) -> Dict[str, Any]:
+        title, artist, album = TRACKS[room.track]
+        return {
+            "status_code": "playing" if room.playing else "stopped",
+            "is_playing": "1" if room.playing else "0",
+            "title": title if room.playing else "",
+            "artist": artist if room.playing else "",
+            "album": album if room.playing else "",
+            "cover": f"/cover/{room.rid}/{room.track}.jpg" if room.playing else "",
+            "current_volume": room.volume,
+            "position": int(room.position),
+            "duration": int(room.duration),
+        }
+
+    # ---------- HTTP ----------
+    async def _handle(self, request: web.Request) -> web.StreamResponse:
+        endpoint = request.match_info["endpoint"]
+        self.stats[endpoint] += 1
+        self.stats["_total"] += 1
+        delay = max(0.0, self.config.latency + self.random.uniform(-self.config.jitter, self.config.jitter))
+        room = self._room(request) if endpoint == "room_player_status" else None
+        if room is not None and room.hang_status:
+            self.stats["_timeouts"] += 1
+            await asyncio.sleep(self.config.hang_seconds)
+        elif self.random.random() < self.config.timeout_rate:
+            self.stats["_timeouts"] += 1
+            await asyncio.sleep(self.config.hang_seconds)
+        elif delay:
+            await asyncio.sleep(delay)
+        if self.random.random() < self.config.failure_rate:
+            self.stats["_failures"] += 1
+            return web.Response(status=500, text="simulated failure")
+        if request.query.get("api_key") != self.config.api_key:
+            return web.json_response({"status": "failed", "error": "invalid api_key"})
+        self._advance()
+        handler = getattr(self, f"_ep_{endpoint}", None)
+        if handler is None:
+            return web.json_response({"status": "failed", "error": f"unknown endpoint {endpoint}"})
+        return handler(request)
+
+    def _room(self, request: web.Request) -> SimRoom | None:
+        return self.rooms.get(request.query.get("room", ""))
+
+    def _ok(self, result: Any = None) -> web.Response:
+        return web.json_response({"status": "succeeded", "result": result if result is not None else {}})
+
+    def _ep_listrooms(self, request: web.Request) -> web.Response:
+        return self._ok({r.rid: {"name": r.name, "is_available": r.available} for r in self.rooms.values()})
+
+    def _ep_room_player_status(self, request: web.Request) -> web.Response:
+        room = self._room(request)
+        if room is None:
+            return web.json_response({"status": "failed", "error": "unknown room"})
+        return self._ok(self._status(room))
+
+    def _ep_get_room_feedback(self, request: web.Request) -> web.Response:
+        rids: List[str] = request.query.getall("room[]", [])
+        playertext, roomvolume = [], []
+        for rid in rids:
+            room = self.rooms.get(rid)
+            if room is None:
+                continue
+            roomvolume.append({"roomid": rid, "roomvol": str(room.volume)})
+            if room.playing:
+                title, artist, album = TRACKS[room.track]
+                playertext.append({"roomid": rid, "roomtext": title, "roomtitle": title, "roomartist": artist, "roomalbum": album})
+        return self._ok({"playertext": playertext, "roomvolume": roomvolume})
+
+    def _ep_listFavorites(self, request: web.Request) -> web.Response:
+        if request.headers.get("If-None-Match") == self._fav_etag:
+            return web.Response(status=304, headers={"ETag": self._fav_etag})
+        resp = self._ok(self.favorites)
+        resp.headers["ETag"] = self._fav_etag
+        return resp
+
+    def _control(self, request: web.Request, apply) -> web.Response:
+        room = self._room(request)
+        if room is None:
+            return web.json_response({"status": "failed", "error": "unknown room"})
+        apply(room)
+        return self._ok()
+
+    def _ep_room_play(self, request: web.Request) -> web.Response:
+        return self._control(request, lambda r: setattr(r, "playing", True))
+
+    def _ep_room_stop(self, request: web.Request) -> web.Response:
+        return self._control(request, lambda r: setattr(r, "playing", False))
+
+    def _ep_room_next(self, request: web.Request) -> web.Response:
+        return self._control(request, lambda r: self._next(r, 1))
+
+    def _ep_room_prev(self, request: web.Request) -> web.Response:
+        return self._control(request, lambda r: self._next(r, -1))
+
+    def _ep_room_vol_set(self, request: web.Request) -> web.Response:
+        vol = max(0, min(100, int(request.query.get("vol", "0"))))
+        return self._control(request, lambda r: setattr(r, "volume", vol))
+
+    def _ep_room_vol_up(self, request: web.Request) -> web.Response:
+        return self._control(request, lambda r: setattr(r, "volume", min(100, r.volume + 2)))
+
+    def _ep_room_vol_down(self, request: web.Request) -> web.Response:
+        return self._control(request, lambda r: setattr(r, "volume", max(0, r.volume - 2)))
+
+    def _ep_playfavorite(self, request: web.Request) -> web.Response:
+        if request.query.get("favId") not in self.favorites:
+            return web.json_response({"status": "failed", "error": "unknown favorite"})
+        return self._control(request, lambda r: setattr(r, "playing", True))
+
+    async def _cover(self, request: web.Request) -> web.Response:
+        self.stats["cover"] += 1
+        return web.Response(body=b"\xff\xd8\xff\xe0" + request.path.encode(), content_type="image/jpeg")
+
+    async def _stats(self, request: web.Request) -> web.Response:
+        return web.json_response(dict(self.stats))
+
+    async def _reset(self, request: web.Request) -> web.Response:
+        self.stats.clear()
+        return web.json_response({})
+
+async def start(sim: VeoovibesSimulator, host: str = "127.0.0.1", port: int = 0) -> tuple[web.AppRunner, int]:
+    runner = web.AppRunner(sim.app(), access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, host, port)
+    await site.start()
+    return runner, runner.addresses[0][1]
+
+def _parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("--host", default="127.0.0.1")
+    p.add_argument("--port", type=int, default=8099)
+    p.add_argument("--rooms", type=int, default=8)
+    p.add_argument("--favorites", type=int, default=20)
+    p.add_argument("--api-key", default="sim")
+    p.add_argument("--latency", type=float, default=0.0)
+    p.add_argument("--jitter", type=float, default=0.0)
+    p.add_argument("--failure-rate", type=float, default=0.0)
+    p.add_argument("--timeout-rate", type=float, default=0.0)
+    p.add_argument("--hang-seconds", type=float, default=30.0)
+    p.add_argument("--seed", type=int)
+    return p
+
+async def _main(args: argparse.Namespace) -> None:
+    config = SimConfig(
+        rooms=args.rooms,
+        favorites=args.favorites,
+        api_key=args.api_key,
+        latency=args.latency,
+        jitter=args.jitter,
+        failure_rate=args.failure_rate,
+        timeout_rate=args.timeout_rate,
+        hang_seconds=args.hang_seconds,
+    )
+    runner, port = await start(VeoovibesSimulator(config, args.seed), args.host, args.port)
+    print(f"veoovibes simulator: {args.rooms} rooms on http://{args.host}:{port} (api_key={args.api_key})", flush=True)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await runner.cleanup()
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(_main(_parser().parse_args()))
+    except KeyboardInterrupt:
+        pass